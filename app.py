@@ -7,30 +7,74 @@ Main Flask application with HTTPS support and authentication
 import os
 import sys
 import json
+import sqlite3
 import requests
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, send_file
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, send_file, Response, stream_with_context, abort
+from flask.json.provider import JSONProvider, DefaultJSONProvider
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+from sqlalchemy import delete, event, exists, func, insert, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import joinedload
 from werkzeug.security import generate_password_hash, check_password_hash
-from werkzeug.utils import secure_filename
-from functools import wraps
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerificationError, InvalidHashError
+except ImportError:
+    PasswordHasher = None
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor, wait
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler import events
 import logging
 from logging.handlers import RotatingFileHandler
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from urllib.parse import quote
 import io
 
+# Application paths, resolved once relative to this file rather than the working directory
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+LOGS_DIR = os.path.join(BASE_DIR, 'logs')
+LOGS_DIR_REAL = os.path.realpath(LOGS_DIR)
+SSL_DIR = os.path.join(BASE_DIR, 'ssl')
+CERT_PATH = os.path.join(SSL_DIR, 'server.crt')
+KEY_PATH = os.path.join(SSL_DIR, 'server.key')
+DB_PATH = os.path.join(BASE_DIR, 'instance', 'vcf_credentials.db')
+GUNICORN_PID_FILE = os.path.join(BASE_DIR, 'gunicorn.pid')
+VERSION_FILE = os.path.join(BASE_DIR, 'static', 'json', 'version.json')
+
+from cryptography import x509
+from cryptography.x509.oid import NameOID
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+# Optional fast JSON parser (falls back to the standard library)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+# Optional YAML support, using the libyaml C loader/dumper when they are available
+try:
+    import yaml
+    YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+except ImportError:
+    yaml = None
+
 from web.models import db, User, Environment, Credential, PasswordHistory, ScheduleConfig
-from web.services import VCFCredentialFetcher, export_to_csv, export_to_excel
+from web.services import VCFCredentialFetcher, export_to_excel, iter_csv
+from web.services.export_utils import DATETIME_FMT
 
 # Configure comprehensive logging
 def setup_logging(app):
     """Setup comprehensive logging for the application"""
     
     # Create logs directory if it doesn't exist
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
+    os.makedirs(LOGS_DIR, exist_ok=True)
     
     # Set logging level based on environment and DEBUG_MODE
     if DEBUG_MODE or app.debug:
@@ -51,7 +95,7 @@ def setup_logging(app):
     
     # File handler for all logs (rotating)
     file_handler = RotatingFileHandler(
-        'logs/vcf_credentials.log',
+        os.path.join(LOGS_DIR, 'vcf_credentials.log'),
         maxBytes=10485760,  # 10MB
         backupCount=10
     )
@@ -60,7 +104,7 @@ def setup_logging(app):
     
     # File handler for errors only
     error_handler = RotatingFileHandler(
-        'logs/vcf_credentials_errors.log',
+        os.path.join(LOGS_DIR, 'vcf_credentials_errors.log'),
         maxBytes=10485760,  # 10MB
         backupCount=10
     )
@@ -97,8 +141,7 @@ def setup_access_logging(app):
     """Setup separate user access logging"""
     
     # Create logs directory if it doesn't exist
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
+    os.makedirs(LOGS_DIR, exist_ok=True)
     
     # Create access logger
     access_logger = logging.getLogger('access')
@@ -113,7 +156,7 @@ def setup_access_logging(app):
     
     # File handler for access logs (rotating)
     access_handler = RotatingFileHandler(
-        'logs/user_access.log',
+        os.path.join(LOGS_DIR, 'user_access.log'),
         maxBytes=10485760,  # 10MB
         backupCount=10
     )
@@ -145,7 +188,7 @@ def log_user_access(username, action, details=None):
 
 def get_version_info():
     """Read version information from static/json/version.json file"""
-    version_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'json', 'version.json')
+    version_file = VERSION_FILE
     
     default_version = {
         "version": "dev",
@@ -170,20 +213,71 @@ def get_version_info():
     return default_version
 
 
+def _json_default(obj):
+    """Serialize types the JSON encoders do not handle natively"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    option = orjson.OPT_NON_STR_KEYS if orjson else 0
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option, default=_json_default).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class IsoJSONProvider(DefaultJSONProvider):
+    """Standard library fallback that emits ISO 8601 datetimes like orjson"""
+    
+    default = staticmethod(_json_default)
+
+
 # Use app logger throughout the application
 logger = None
 access_logger = None
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app) if orjson else IsoJSONProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', os.urandom(24).hex())
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///vcf_credentials.db'
+os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{DB_PATH}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Pool sized for request threads plus the scheduler's worker threads in each process
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 20,
+    'max_overflow': 10,
+    'pool_pre_ping': True,
+    'pool_recycle': 300,
+}
+
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so exports and page loads can read while a sync is writing"""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.close()
 
 # Debug mode - set via environment variable
 # DEBUG_MODE=true for verbose logging
 DEBUG_MODE = os.environ.get('DEBUG_MODE', 'false').lower() == 'true'
 
+# Interpreter version shown on the server settings page
+PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+
 # Setup logging
 setup_logging(app)
 access_logger = setup_access_logging(app)
@@ -219,6 +313,9 @@ scheduler.add_listener(scheduler_job_submitted, events.EVENT_JOB_SUBMITTED)
 scheduler.start()
 app.logger.info("Background scheduler started")
 
+# Shared VCF API client so HTTPS connections are pooled across requests and sync jobs
+vcf_fetcher = VCFCredentialFetcher()
+
 
 @login_manager.user_loader
 def load_user(user_id):
@@ -245,6 +342,45 @@ def check_readonly():
     return None
 
 
+# =============================================================================
+# Password Hashing
+# =============================================================================
+
+# Argon2id via argon2-cffi when available; Werkzeug pbkdf2 otherwise.
+# Legacy Werkzeug hashes still verify and are upgraded on the next login.
+password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1) if PasswordHasher else None
+
+
+def hash_password(password):
+    """Hash a password with the preferred algorithm"""
+    if password_hasher:
+        return password_hasher.hash(password)
+    return generate_password_hash(password)
+
+
+def verify_password(password_hash, password):
+    """Check a password against a stored hash (argon2 or legacy Werkzeug)"""
+    if not password_hash or password is None:
+        return False
+    if password_hash.startswith('$argon2'):
+        if not password_hasher:
+            return False
+        try:
+            return password_hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(password_hash, password)
+
+
+def password_needs_rehash(password_hash):
+    """Return True if the stored hash should be upgraded to current parameters"""
+    if not password_hasher:
+        return False
+    if not password_hash.startswith('$argon2'):
+        return True
+    return password_hasher.check_needs_rehash(password_hash)
+
+
 # =============================================================================
 # Input Validation Functions
 # =============================================================================
@@ -264,6 +400,40 @@ ENV_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9 ._-]*$')
 # Description validation constants
 DESCRIPTION_MAX_LENGTH = 500
 
+# Environment import file extensions
+IMPORT_FILE_EXTENSIONS = frozenset({'json', 'yaml', 'yml'})
+
+# Credential fields exposed by the credentials API, in response order
+CREDENTIAL_API_FIELDS = {
+    'id': Credential.id,
+    'hostname': Credential.hostname,
+    'username': Credential.username,
+    'password': Credential.password,
+    'credential_type': Credential.credential_type,
+    'account_type': Credential.account_type,
+    'resource_type': Credential.resource_type,
+    'domain_name': Credential.domain_name,
+    'source': Credential.source,
+    'last_updated': Credential.last_updated,
+}
+CREDENTIALS_MAX_PER_PAGE = 1000
+
+# Log file names served by the log viewer (e.g. app.log, app.log.3)
+LOG_FILENAME_PATTERN = re.compile(r'^[\w\-.]+\.log(?:\.\d+)?$')
+
+# Internal Nginx location serving LOGS_DIR when the proxy sends X-Sendfile-Type: X-Accel-Redirect
+LOGS_ACCEL_REDIRECT_PREFIX = '/protected-logs/'
+
+# Bytes of a log file copied into the export archive between flushes to the client
+LOG_EXPORT_BLOCK_SIZE = 64 * 1024
+
+# Timestamp suffix for download filenames and certificate backups
+FILENAME_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+# Scheduler job ids (env_sync_{env_id}_{type}) and interval trigger strings
+SCHEDULER_JOB_ID_PATTERN = re.compile(r'env_sync_(\d+)_(\w+)')
+INTERVAL_TRIGGER_PATTERN = re.compile(r'interval\[(\d+):(\d+):(\d+)\]')
+
 # Hostname validation constants
 HOSTNAME_MAX_LENGTH = 255
 HOSTNAME_PATTERN = re.compile(
@@ -533,6 +703,10 @@ def fetch_credentials_for_environment(env_id, source=None):
     Args:
         env_id: Environment ID to sync
         source: Optional - 'installer', 'manager', or None for both
+    
+    Returns:
+        tuple: (sync_status: str or None, credential_count: int or None).
+        credential_count is only known when a full sync processed credentials.
     """
     source_desc = f" ({source})" if source else ""
     app.logger.info(f"Scheduled sync starting for environment ID: {env_id}{source_desc}")
@@ -542,54 +716,57 @@ def fetch_credentials_for_environment(env_id, source=None):
             environment = db.session.get(Environment, env_id)
             if not environment:
                 app.logger.error(f"Environment {env_id} not found")
-                return
+                return None, None
 
             app.logger.info(f"Fetching credentials for environment: {environment.name} (ID: {env_id}){source_desc}")
-            fetcher = VCFCredentialFetcher()
-            
             credentials = []
             installer_error = environment.installer_error  # Preserve existing errors
             manager_error = environment.manager_error
             installer_success = False
             manager_success = False
             
-            # Fetch from installer if configured and requested
+            # Fetch from installer and/or manager concurrently
+            targets = []
             fetch_installer = (source is None or source == 'installer') and environment.installer_host
             if fetch_installer:
-                try:
-                    app.logger.debug(f"Fetching from installer: {environment.installer_host}")
-                    installer_creds = fetcher.fetch_from_installer(
-                        host=environment.installer_host,
-                        username=environment.installer_username,
-                        password=environment.installer_password,
-                        ssl_verify=environment.installer_ssl_verify
-                    )
-                    credentials.extend(installer_creds)
-                    app.logger.info(f"Fetched {len(installer_creds)} credentials from installer")
-                    installer_success = True
-                    installer_error = None
-                except Exception as e:
-                    installer_error = _get_friendly_error_message(e)
-                    app.logger.error(f"Failed to fetch from installer {environment.installer_host}: {installer_error}")
-            
-            # Fetch from manager if configured and requested
+                app.logger.debug(f"Fetching from installer: {environment.installer_host}")
+                targets.append({
+                    'kind': 'installer',
+                    'host': environment.installer_host,
+                    'username': environment.installer_username,
+                    'password': environment.installer_password,
+                    'ssl_verify': environment.installer_ssl_verify
+                })
             fetch_manager = (source is None or source == 'manager') and environment.manager_host
             if fetch_manager:
-                try:
-                    app.logger.debug(f"Fetching from manager: {environment.manager_host}")
-                    manager_creds = fetcher.fetch_from_manager(
-                        host=environment.manager_host,
-                        username=environment.manager_username,
-                        password=environment.manager_password,
-                        ssl_verify=environment.manager_ssl_verify
-                    )
-                    credentials.extend(manager_creds)
-                    app.logger.info(f"Fetched {len(manager_creds)} credentials from manager")
+                app.logger.debug(f"Fetching from manager: {environment.manager_host}")
+                targets.append({
+                    'kind': 'manager',
+                    'host': environment.manager_host,
+                    'username': environment.manager_username,
+                    'password': environment.manager_password,
+                    'ssl_verify': environment.manager_ssl_verify
+                })
+            
+            for result in vcf_fetcher.fetch_all(targets):
+                kind = result['kind']
+                if result['error'] is not None:
+                    error_message = _get_friendly_error_message(result['error'])
+                    app.logger.error(f"Failed to fetch from {kind} {result['host']}: {error_message}")
+                    if kind == 'installer':
+                        installer_error = error_message
+                    else:
+                        manager_error = error_message
+                    continue
+                
+                credentials.extend(result['credentials'])
+                app.logger.info(f"Fetched {len(result['credentials'])} credentials from {kind}")
+                if kind == 'installer':
+                    installer_success = True
+                    installer_error = None
+                else:
                     manager_success = True
                     manager_error = None
-                except Exception as e:
-                    manager_error = _get_friendly_error_message(e)
-                    app.logger.error(f"Failed to fetch from manager {environment.manager_host}: {manager_error}")
             
             # Determine sync status based on what was fetched
             if source == 'installer':
@@ -627,28 +804,31 @@ def fetch_credentials_for_environment(env_id, source=None):
             
             # Update database with new credentials and track password changes
             # Only process credentials if we got any
+            credential_count = None
             if credentials:
                 app.logger.debug(f"Updating database with {len(credentials)} credentials")
                 
-                # Get existing credentials for comparison
+                # Get existing credentials for comparison as plain rows (no ORM objects needed)
                 # Key is (hostname, credential_type, username, source) - the unique identity
                 # When syncing a single source, only load credentials from that source
+                existing_stmt = select(
+                    Credential.id, Credential.hostname, Credential.credential_type,
+                    Credential.username, Credential.source, Credential.password, Credential.last_updated
+                ).where(Credential.environment_id == env_id)
                 if source:
                     source_filter = 'VCF_INSTALLER' if source == 'installer' else 'SDDC_MANAGER'
-                    existing_creds = {
-                        (c.hostname, c.credential_type, c.username, c.source): c 
-                        for c in Credential.query.filter_by(environment_id=env_id, source=source_filter).all()
-                    }
-                else:
-                    existing_creds = {
-                        (c.hostname, c.credential_type, c.username, c.source): c 
-                        for c in Credential.query.filter_by(environment_id=env_id).all()
-                    }
+                    existing_stmt = existing_stmt.where(Credential.source == source_filter)
+                existing_creds = {
+                    (row.hostname, row.credential_type, row.username, row.source): row
+                    for row in db.session.execute(existing_stmt)
+                }
+                existing_total = len(existing_creds)
                 
-                # Track changes
-                updated_count = 0
-                new_count = 0
-                password_changes = 0
+                # Collect rows and write them with one executemany per statement
+                now = datetime.now(timezone.utc)
+                new_rows = []
+                update_rows = []
+                history_rows = []
                 seen_keys = set()  # Track keys we've processed to avoid duplicates from API
                 
                 for cred_data in credentials:
@@ -672,62 +852,71 @@ def fetch_credentials_for_environment(env_id, source=None):
                         continue
                     seen_keys.add(key)
                     
-                    if key in existing_creds:
-                        existing_cred = existing_creds[key]
-                        
+                    values = {
+                        'password': new_password,
+                        'account_type': cred_data.get('accountType', 'USER'),
+                        'resource_type': cred_data.get('resourceType', ''),
+                        'domain_name': cred_data.get('domainName', ''),
+                        'last_updated': now,
+                    }
+                    
+                    existing_cred = existing_creds.pop(key, None)
+                    if existing_cred is not None:
                         # Check if password changed - save old password to history
                         if existing_cred.password != new_password and existing_cred.password:
-                            history_entry = PasswordHistory(
-                                credential_id=existing_cred.id,
-                                password=existing_cred.password,
-                                changed_at=existing_cred.last_updated or datetime.now(timezone.utc),
-                                changed_by='SYNC'
-                            )
-                            db.session.add(history_entry)
-                            password_changes += 1
+                            history_rows.append({
+                                'credential_id': existing_cred.id,
+                                'password': existing_cred.password,
+                                'changed_at': existing_cred.last_updated or now,
+                                'changed_by': 'SYNC',
+                            })
                             app.logger.info(f"Password changed for {hostname}:{username} ({credential_type}) from {cred_source}")
                         
-                        # Update credential with new data
-                        existing_cred.password = new_password
-                        existing_cred.account_type = cred_data.get('accountType', 'USER')
-                        existing_cred.resource_type = cred_data.get('resourceType', '')
-                        existing_cred.domain_name = cred_data.get('domainName', '')
-                        existing_cred.source = cred_source
-                        existing_cred.last_updated = datetime.now(timezone.utc)
-                        updated_count += 1
-                        
-                        del existing_creds[key]
+                        values['id'] = existing_cred.id
+                        update_rows.append(values)
                     else:
-                        new_cred = Credential(
+                        values.update(
                             environment_id=env_id,
                             hostname=hostname,
                             username=username,
-                            password=new_password,
                             credential_type=credential_type,
-                            account_type=cred_data.get('accountType', 'USER'),
-                            resource_type=cred_data.get('resourceType', ''),
-                            domain_name=cred_data.get('domainName', ''),
                             source=cred_source,
-                            last_updated=datetime.now(timezone.utc)
                         )
-                        db.session.add(new_cred)
-                        new_count += 1
+                        new_rows.append(values)
+                
+                if history_rows:
+                    db.session.execute(insert(PasswordHistory), history_rows)
+                if update_rows:
+                    # ORM bulk UPDATE by primary key
+                    db.session.execute(update(Credential), update_rows)
+                if new_rows:
+                    db.session.execute(insert(Credential), new_rows)
+                
+                updated_count = len(update_rows)
+                new_count = len(new_rows)
+                password_changes = len(history_rows)
                 
                 # Only remove credentials that are no longer present from the synced source(s)
                 # For single-source sync: only remove credentials from that source
                 # For full sync: only remove if sync was fully successful
-                removed_count = 0
-                if source:
-                    # Single source sync - safe to remove credentials from this source that weren't returned
-                    for old_cred in existing_creds.values():
-                        db.session.delete(old_cred)
-                        removed_count += 1
-                elif sync_status == 'success':
-                    # Full sync was successful - safe to remove all missing credentials
-                    for old_cred in existing_creds.values():
-                        db.session.delete(old_cred)
-                        removed_count += 1
                 # If sync_status is 'partial' or 'failed' for a full sync, don't remove anything
+                removed_count = 0
+                if existing_creds and (source or sync_status == 'success'):
+                    stale_ids = [row.id for row in existing_creds.values()]
+                    # Bulk deletes bypass the ORM cascade, so clear history first
+                    db.session.execute(
+                        delete(PasswordHistory).where(PasswordHistory.credential_id.in_(stale_ids)),
+                        execution_options={'synchronize_session': False}
+                    )
+                    db.session.execute(
+                        delete(Credential).where(Credential.id.in_(stale_ids)),
+                        execution_options={'synchronize_session': False}
+                    )
+                    removed_count = len(stale_ids)
+                
+                if not source:
+                    # Full sync loaded every credential of the environment
+                    credential_count = existing_total + new_count - removed_count
                 
                 app.logger.info(
                     f"Sync {sync_status} for {environment.name}: "
@@ -740,6 +929,7 @@ def fetch_credentials_for_environment(env_id, source=None):
             environment.last_sync = datetime.now(timezone.utc)
             db.session.commit()
             app.logger.info(f"Sync completed and committed for {environment.name}: status={sync_status}")
+            return sync_status, credential_count
             
         except Exception as e:
             app.logger.error(f"Error fetching credentials for environment {env_id}: {_get_friendly_error_message(e)}")
@@ -755,6 +945,7 @@ def fetch_credentials_for_environment(env_id, source=None):
             except Exception as save_error:
                 app.logger.error(f"Could not save error status: {save_error}")
                 db.session.rollback()
+            return 'failed', None
 
 
 def schedule_environment_sync(environment):
@@ -824,7 +1015,6 @@ def schedule_environment_sync(environment):
 
 def _migrate_database():
     """Add any missing columns to existing database tables and clean up duplicates."""
-    import sqlite3
     
     db_path = app.config['SQLALCHEMY_DATABASE_URI'].replace('sqlite:///', '')
     app.logger.info(f"Checking database migration for: {db_path}")
@@ -862,6 +1052,18 @@ def _migrate_database():
         else:
             app.logger.debug(f"Column {column_name} already exists")
     
+    # Add indexes declared on the models (create_all only builds them for new tables)
+    indexes_to_add = [
+        ("ix_credentials_environment_source", "credentials (environment_id, source)"),
+        ("ix_password_history_credential_changed", "password_history (credential_id, changed_at)"),
+    ]
+    
+    for index_name, index_def in indexes_to_add:
+        try:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {index_def}")
+        except sqlite3.OperationalError as e:
+            app.logger.warning(f"Could not create index {index_name}: {e}")
+    
     # Clean up duplicate credentials - keep only the most recent one for each unique key
     # Unique key: environment_id + hostname + credential_type + username + source
     app.logger.info("Checking for duplicate credentials...")
@@ -932,7 +1134,7 @@ def init_database():
             if User.query.count() == 0:
                 admin = User(
                     username='admin',
-                    password_hash=generate_password_hash('admin'),
+                    password_hash=hash_password('admin'),
                     is_admin=True,
                     role='admin'
                 )
@@ -1010,7 +1212,12 @@ def login():
         app.logger.info(f"Login attempt for user: {username}")
         user = User.query.filter_by(username=username).first()
         
-        if user and check_password_hash(user.password_hash, password):
+        if user and verify_password(user.password_hash, password):
+            # Lazily migrate legacy or outdated hashes on successful login
+            if password_needs_rehash(user.password_hash):
+                user.password_hash = hash_password(password)
+                db.session.commit()
+                app.logger.info(f"Upgraded password hash for user: {username}")
             login_user(user)
             app.logger.info(f"Successful login for user: {username}")
             log_user_access(username, 'LOGIN', f"role={user.role}")
@@ -1046,7 +1253,7 @@ def change_password():
         app.logger.info(f"Password change attempt for user: {current_user.username}")
         
         # Validate current password
-        if not check_password_hash(current_user.password_hash, current_password):
+        if not verify_password(current_user.password_hash, current_password):
             app.logger.warning(f"Password change failed - invalid current password for user: {current_user.username}")
             flash('Current password is incorrect', 'error')
             return render_template('change_password.html')
@@ -1061,7 +1268,7 @@ def change_password():
             return render_template('change_password.html')
         
         # Update password
-        current_user.password_hash = generate_password_hash(new_password)
+        current_user.password_hash = hash_password(new_password)
         db.session.commit()
         
         app.logger.info(f"Password changed successfully for user: {current_user.username}")
@@ -1101,9 +1308,7 @@ def settings_ssl():
 @admin_required
 def settings_server():
     """Server management page - admin only"""
-    import sys
-    python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-    return render_template('settings_server.html', python_version=python_version)
+    return render_template('settings_server.html', python_version=PYTHON_VERSION)
 
 
 @app.route('/settings/scheduler')
@@ -1156,7 +1361,7 @@ def add_user():
         # Create new user
         new_user = User(
             username=username,
-            password_hash=generate_password_hash(password),
+            password_hash=hash_password(password),
             is_admin=(role == 'admin'),
             role=role
         )
@@ -1215,8 +1420,7 @@ def delete_user(user_id):
 def upload_ssl_certificates():
     """Upload and validate SSL certificates"""
     try:
-        import ssl
-        import tempfile
+        import hmac
         import subprocess
         
         cert_file = request.files.get('cert_file')
@@ -1226,83 +1430,77 @@ def upload_ssl_certificates():
             flash('Both certificate and key files are required', 'error')
             return redirect(url_for('settings_ssl'))
         
-        # Save files temporarily for validation
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.crt') as cert_tmp:
-            cert_file.save(cert_tmp.name)
-            cert_path = cert_tmp.name
+        # Keep uploads in memory and feed them to openssl via stdin
+        cert_bytes = cert_file.read()
+        key_bytes = key_file.read()
         
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.key') as key_tmp:
-            key_file.save(key_tmp.name)
-            key_path = key_tmp.name
+        # Validate certificate
+        result = subprocess.run(
+            ['openssl', 'x509', '-noout', '-text'],
+            input=cert_bytes,
+            capture_output=True,
+            check=False
+        )
+        if result.returncode != 0:
+            flash('Invalid certificate file', 'error')
+            return redirect(url_for('settings_ssl'))
+        
+        # Validate private key
+        result = subprocess.run(
+            ['openssl', 'rsa', '-check', '-noout'],
+            input=key_bytes,
+            capture_output=True,
+            check=False
+        )
+        if result.returncode != 0:
+            flash('Invalid private key file', 'error')
+            return redirect(url_for('settings_ssl'))
+        
+        # Verify certificate and key match (compare raw bytes, constant time)
+        cert_modulus = subprocess.run(
+            ['openssl', 'x509', '-noout', '-modulus'],
+            input=cert_bytes,
+            capture_output=True,
+            check=False
+        ).stdout.strip()
+        
+        key_modulus = subprocess.run(
+            ['openssl', 'rsa', '-noout', '-modulus'],
+            input=key_bytes,
+            capture_output=True,
+            check=False
+        ).stdout.strip()
+        
+        if not cert_modulus or not hmac.compare_digest(cert_modulus, key_modulus):
+            flash('Certificate and private key do not match', 'error')
+            return redirect(url_for('settings_ssl'))
+        
+        # Create ssl directory if it doesn't exist
+        os.makedirs(SSL_DIR, exist_ok=True)
+        
+        # Backup existing certificates
+        cert_dest = CERT_PATH
+        key_dest = KEY_PATH
+        
+        if os.path.exists(cert_dest):
+            os.rename(cert_dest, cert_dest + '.backup')
+        if os.path.exists(key_dest):
+            os.rename(key_dest, key_dest + '.backup')
+        
+        # Write new certificates
+        with open(cert_dest, 'wb') as f:
+            f.write(cert_bytes)
+        # Create the key owner-only from the start rather than chmod after writing
+        with os.fdopen(os.open(key_dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            f.write(key_bytes)
+        
+        # Set proper permissions
+        os.chmod(cert_dest, 0o644)
+        os.chmod(key_dest, 0o600)
+        
+        app.logger.info("SSL certificates updated successfully")
+        flash('SSL certificates updated successfully. Please restart the server for changes to take effect.', 'success')
         
-        try:
-            # Validate certificate
-            result = subprocess.run(
-                ['openssl', 'x509', '-in', cert_path, '-noout', '-text'],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                flash('Invalid certificate file', 'error')
-                return redirect(url_for('settings_ssl'))
-            
-            # Validate private key
-            result = subprocess.run(
-                ['openssl', 'rsa', '-in', key_path, '-check', '-noout'],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                flash('Invalid private key file', 'error')
-                return redirect(url_for('settings_ssl'))
-            
-            # Verify certificate and key match
-            cert_modulus = subprocess.run(
-                ['openssl', 'x509', '-noout', '-modulus', '-in', cert_path],
-                capture_output=True,
-                text=True
-            ).stdout.strip()
-            
-            key_modulus = subprocess.run(
-                ['openssl', 'rsa', '-noout', '-modulus', '-in', key_path],
-                capture_output=True,
-                text=True
-            ).stdout.strip()
-            
-            if cert_modulus != key_modulus:
-                flash('Certificate and private key do not match', 'error')
-                return redirect(url_for('settings_ssl'))
-            
-            # Create ssl directory if it doesn't exist
-            ssl_dir = os.path.join(os.getcwd(), 'ssl')
-            os.makedirs(ssl_dir, exist_ok=True)
-            
-            # Backup existing certificates
-            cert_dest = os.path.join(ssl_dir, 'server.crt')
-            key_dest = os.path.join(ssl_dir, 'server.key')
-            
-            if os.path.exists(cert_dest):
-                os.rename(cert_dest, cert_dest + '.backup')
-            if os.path.exists(key_dest):
-                os.rename(key_dest, key_dest + '.backup')
-            
-            # Copy new certificates
-            import shutil
-            shutil.copy2(cert_path, cert_dest)
-            shutil.copy2(key_path, key_dest)
-            
-            # Set proper permissions
-            os.chmod(cert_dest, 0o644)
-            os.chmod(key_dest, 0o600)
-            
-            app.logger.info("SSL certificates updated successfully")
-            flash('SSL certificates updated successfully. Please restart the server for changes to take effect.', 'success')
-            
-        finally:
-            # Clean up temporary files
-            os.unlink(cert_path)
-            os.unlink(key_path)
-            
     except Exception as e:
         app.logger.error(f"Error uploading SSL certificates: {e}", exc_info=True)
         flash('Failed to upload SSL certificates', 'error')
@@ -1336,7 +1534,7 @@ def api_environments():
             # Legacy fields
             'sync_enabled': env.sync_enabled,
             'sync_interval_minutes': env.sync_interval_minutes,
-            'last_sync': env.last_sync.isoformat() if env.last_sync else None,
+            'last_sync': env.last_sync,
             'last_sync_status': env.last_sync_status or 'never',
             'installer_error': env.installer_error,
             'manager_error': env.manager_error,
@@ -1400,8 +1598,6 @@ def api_environments():
 @login_required
 def api_import_environment():
     """Import environment from JSON or YAML file"""
-    import json
-    
     # Check if user is readonly
     readonly_check = check_readonly()
     if readonly_check:
@@ -1414,29 +1610,27 @@ def api_import_environment():
     if not file.filename:
         return jsonify({'success': False, 'errors': ['No file selected']}), 400
     
-    # Check file extension
-    filename = secure_filename(file.filename)
-    ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    # Check file extension (the upload is never written to disk by name)
+    ext = os.path.splitext(file.filename)[1].lower().lstrip('.')
     
-    if ext not in ['json', 'yaml', 'yml']:
+    if ext not in IMPORT_FILE_EXTENSIONS:
         return jsonify({'success': False, 'errors': ['Invalid file type. Supported: .json, .yaml, .yml']}), 400
     
     try:
-        content = file.read().decode('utf-8')
+        content = file.read()
         
-        # Parse file based on extension
+        # Parse file based on extension (both parsers accept raw UTF-8 bytes)
         if ext == 'json':
             try:
-                data = json.loads(content)
+                data = json_loads(content)
             except json.JSONDecodeError as e:
                 return jsonify({'success': False, 'errors': [f'Invalid JSON: {str(e)}']}), 400
         else:
             # YAML
-            try:
-                import yaml
-                data = yaml.safe_load(content)
-            except ImportError:
+            if yaml is None:
                 return jsonify({'success': False, 'errors': ['YAML support not available. Install PyYAML: pip install pyyaml']}), 400
+            try:
+                data = yaml.load(content, Loader=YAML_LOADER)
             except yaml.YAMLError as e:
                 return jsonify({'success': False, 'errors': [f'Invalid YAML: {str(e)}']}), 400
         
@@ -1447,9 +1641,12 @@ def api_import_environment():
         is_valid, validation_errors = validate_environment_data(data, is_update=False)
         errors = list(validation_errors) if validation_errors else []
         
-        # Check if environment name already exists
-        if data.get('name') and Environment.query.filter_by(name=data['name'].strip()).first():
-            errors.append(f'Environment with name "{data["name"]}" already exists')
+        # Check if environment name already exists (primary key probe only)
+        with db.session.no_autoflush:
+            if data.get('name') and db.session.scalar(
+                select(Environment.id).where(Environment.name == data['name'].strip())
+            ) is not None:
+                errors.append(f'Environment with name "{data["name"]}" already exists')
         
         has_installer = data.get('installer_host') and data.get('installer_username') and data.get('installer_password')
         has_manager = data.get('manager_host') and data.get('manager_username') and data.get('manager_password')
@@ -1463,15 +1660,15 @@ def api_import_environment():
         # Test connections
         app.logger.info(f"Testing connections for imported environment: {data.get('name')}")
         connection_tests = {'installer': None, 'manager': None}
-        fetcher = VCFCredentialFetcher()
         
         if has_installer:
             try:
-                token = fetcher._get_token(
+                token = vcf_fetcher._get_token(
                     host=data['installer_host'],
                     username=data['installer_username'],
                     password=data['installer_password'],
-                    ssl_verify=data.get('installer_ssl_verify', True)
+                    ssl_verify=data.get('installer_ssl_verify', True),
+                    use_cache=False
                 )
                 if token:
                     connection_tests['installer'] = {'success': True, 'message': 'Connection successful'}
@@ -1485,11 +1682,12 @@ def api_import_environment():
         
         if has_manager:
             try:
-                token = fetcher._get_token(
+                token = vcf_fetcher._get_token(
                     host=data['manager_host'],
                     username=data['manager_username'],
                     password=data['manager_password'],
-                    ssl_verify=data.get('manager_ssl_verify', True)
+                    ssl_verify=data.get('manager_ssl_verify', True),
+                    use_cache=False
                 )
                 if token:
                     connection_tests['manager'] = {'success': True, 'message': 'Connection successful'}
@@ -1577,7 +1775,7 @@ def api_environment(env_id):
             # Legacy fields
             'sync_enabled': environment.sync_enabled,
             'sync_interval_minutes': environment.sync_interval_minutes,
-            'last_sync': environment.last_sync.isoformat() if environment.last_sync else None
+            'last_sync': environment.last_sync
         })
     
     elif request.method == 'PUT':
@@ -1599,6 +1797,8 @@ def api_environment(env_id):
             if existing and existing.id != environment.id:
                 return jsonify({'error': f'Environment with name "{data["name"]}" already exists'}), 400
         
+        schedule_fingerprint = environment.sync_schedule_fingerprint
+        
         # Update fields with sanitized values
         if 'name' in data:
             environment.name = data['name'].strip()
@@ -1639,8 +1839,11 @@ def api_environment(env_id):
         
         db.session.commit()
         
-        # Update schedule
-        schedule_environment_sync(environment)
+        # Only reschedule when a field affecting the sync jobs changed
+        if environment.sync_schedule_fingerprint != schedule_fingerprint:
+            schedule_environment_sync(environment)
+        else:
+            app.logger.debug(f"Sync schedule unchanged for {environment.name}, skipping reschedule")
         
         return jsonify({'message': 'Environment updated successfully'})
     
@@ -1685,12 +1888,15 @@ def api_sync_environment(env_id):
     
     app.logger.info(f"Manual sync triggered for environment: {environment.name} (ID: {env_id})")
     try:
-        fetch_credentials_for_environment(env_id)
+        _, credential_count = fetch_credentials_for_environment(env_id)
         
         # Refresh environment to get updated status
         db.session.refresh(environment)
         
-        credential_count = Credential.query.filter_by(environment_id=env_id).count()
+        if credential_count is None:
+            credential_count = db.session.scalar(
+                select(func.count(Credential.id)).where(Credential.environment_id == env_id)
+            )
         
         response_data = {
             'message': 'Sync completed',
@@ -1721,26 +1927,19 @@ def api_sync_environment(env_id):
 @admin_required
 def api_scheduler_status():
     """Get scheduler status and list of scheduled jobs (admin only)"""
-    import re
-    from datetime import datetime
-    
     # Build a cache of environment names for quick lookup
     environments = {env.id: env for env in Environment.query.all()}
     
     jobs = []
     now = datetime.now()
+    # Compare POSIX timestamps so no per-job datetime copies are needed
+    now_ts = now.timestamp()
     for job in scheduler.get_jobs():
         next_run = job.next_run_time
         time_until = None
         time_until_seconds = None
         if next_run:
-            # Make both timezone-naive for comparison
-            if next_run.tzinfo:
-                next_run_naive = next_run.replace(tzinfo=None)
-            else:
-                next_run_naive = next_run
-            delta = next_run_naive - now
-            time_until_seconds = int(delta.total_seconds())
+            time_until_seconds = int(next_run.timestamp() - now_ts)
             if time_until_seconds > 0:
                 if time_until_seconds < 60:
                     time_until = f"{time_until_seconds} seconds"
@@ -1759,7 +1958,7 @@ def api_scheduler_status():
         sync_type = None
         environment_id = None
         
-        match = re.match(r'env_sync_(\d+)_(\w+)', job.id)
+        match = SCHEDULER_JOB_ID_PATTERN.match(job.id)
         if match:
             environment_id = int(match.group(1))
             sync_type = match.group(2)
@@ -1770,7 +1969,7 @@ def api_scheduler_status():
         # Extract interval from trigger string (e.g., "interval[0:30:00]" -> 30 minutes)
         interval_minutes = None
         trigger_str = str(job.trigger)
-        interval_match = re.search(r'interval\[(\d+):(\d+):(\d+)\]', trigger_str)
+        interval_match = INTERVAL_TRIGGER_PATTERN.search(trigger_str)
         if interval_match:
             hours = int(interval_match.group(1))
             minutes = int(interval_match.group(2))
@@ -1783,7 +1982,7 @@ def api_scheduler_status():
             'environment_id': environment_id,
             'sync_type': sync_type,
             'interval_minutes': interval_minutes,
-            'next_run_time': next_run.isoformat() if next_run else None,
+            'next_run_time': next_run,
             'next_run_time_local': next_run.strftime('%Y-%m-%d %H:%M:%S') if next_run else None,
             'time_until_next_run': time_until,
             'time_until_seconds': time_until_seconds,
@@ -1816,19 +2015,18 @@ def api_scheduler_reschedule():
             scheduler.start()
         
         environments = Environment.query.all()
-        scheduled_count = 0
         
         for env in environments:
             app.logger.info(f"Rescheduling jobs for environment '{env.name}' (id={env.id})")
             schedule_environment_sync(env)
-            
-            # Check if any jobs were actually scheduled
-            installer_job = scheduler.get_job(f"env_sync_{env.id}_installer")
-            manager_job = scheduler.get_job(f"env_sync_{env.id}_manager")
-            if installer_job or manager_job:
-                scheduled_count += 1
         
+        # Check which environments actually got jobs using a single jobstore read
         all_jobs = scheduler.get_jobs()
+        job_ids = {job.id for job in all_jobs}
+        scheduled_count = sum(
+            1 for env in environments
+            if f"env_sync_{env.id}_installer" in job_ids or f"env_sync_{env.id}_manager" in job_ids
+        )
         
         return jsonify({
             'success': True,
@@ -1856,51 +2054,39 @@ def test_credentials():
         'manager': {'success': False, 'message': ''}
     }
     
-    fetcher = VCFCredentialFetcher()
-    
-    # Test installer if provided
-    if data.get('installer_host') and data.get('installer_username') and data.get('installer_password'):
+    def test_connection(kind):
+        """Request a token for one source and record the outcome in results"""
+        host = data[f'{kind}_host']
+        label = kind.capitalize()
         try:
-            app.logger.info(f"Testing installer connection: {data['installer_host']}")
+            app.logger.info(f"Testing {kind} connection: {host}")
             # Try to get token
-            token = fetcher._get_token(
-                host=data['installer_host'],
-                username=data['installer_username'],
-                password=data['installer_password'],
-                ssl_verify=data.get('installer_ssl_verify', True)
+            token = vcf_fetcher._get_token(
+                host=host,
+                username=data[f'{kind}_username'],
+                password=data[f'{kind}_password'],
+                ssl_verify=data.get(f'{kind}_ssl_verify', True),
+                use_cache=False
             )
             if token:
-                results['installer']['success'] = True
-                results['installer']['message'] = 'Connection successful'
-                app.logger.info(f"Installer test successful: {data['installer_host']}")
+                results[kind]['success'] = True
+                results[kind]['message'] = 'Connection successful'
+                app.logger.info(f"{label} test successful: {host}")
             else:
-                results['installer']['message'] = 'Failed to obtain authentication token'
-                app.logger.warning(f"Installer test failed - no token: {data['installer_host']}")
+                results[kind]['message'] = 'Failed to obtain authentication token'
+                app.logger.warning(f"{label} test failed - no token: {host}")
         except Exception as e:
-            results['installer']['message'] = f'Connection failed: {str(e)}'
-            app.logger.error(f"Installer test failed: {data['installer_host']} - {e}")
+            results[kind]['message'] = f'Connection failed: {str(e)}'
+            app.logger.error(f"{label} test failed: {host} - {e}")
     
-    # Test manager if provided
-    if data.get('manager_host') and data.get('manager_username') and data.get('manager_password'):
-        try:
-            app.logger.info(f"Testing manager connection: {data['manager_host']}")
-            # Try to get token
-            token = fetcher._get_token(
-                host=data['manager_host'],
-                username=data['manager_username'],
-                password=data['manager_password'],
-                ssl_verify=data.get('manager_ssl_verify', True)
-            )
-            if token:
-                results['manager']['success'] = True
-                results['manager']['message'] = 'Connection successful'
-                app.logger.info(f"Manager test successful: {data['manager_host']}")
-            else:
-                results['manager']['message'] = 'Failed to obtain authentication token'
-                app.logger.warning(f"Manager test failed - no token: {data['manager_host']}")
-        except Exception as e:
-            results['manager']['message'] = f'Connection failed: {str(e)}'
-            app.logger.error(f"Manager test failed: {data['manager_host']} - {e}")
+    # Test installer and manager in parallel when provided
+    kinds = [
+        kind for kind in ('installer', 'manager')
+        if data.get(f'{kind}_host') and data.get(f'{kind}_username') and data.get(f'{kind}_password')
+    ]
+    if kinds:
+        with ThreadPoolExecutor(max_workers=len(kinds)) as executor:
+            wait([executor.submit(test_connection, kind) for kind in kinds])
     
     # Check if at least one succeeded
     overall_success = results['installer']['success'] or results['manager']['success']
@@ -1914,32 +2100,60 @@ def test_credentials():
 @app.route('/api/environments/<int:env_id>/credentials', methods=['GET'])
 @login_required
 def api_credentials(env_id):
-    """Get credentials for an environment"""
-    credentials = Credential.query.filter_by(environment_id=env_id).all()
-    
-    return jsonify([{
-        'id': cred.id,
-        'hostname': cred.hostname,
-        'username': cred.username,
-        'password': cred.password,
-        'credential_type': cred.credential_type,
-        'account_type': cred.account_type,
-        'resource_type': cred.resource_type,
-        'domain_name': cred.domain_name,
-        'source': cred.source,
-        'last_updated': cred.last_updated.isoformat() if cred.last_updated else None,
-        'has_history': len(cred.password_history) > 0
-    } for cred in credentials])
+    """Get credentials for an environment
+    
+    Query parameters (all optional):
+        fields: comma-separated list of fields to return (default: all)
+        page, per_page: return one page wrapped as {'items', 'total', 'page', 'per_page'}
+                        instead of the full list
+    """
+    fields = request.args.get('fields')
+    if fields:
+        fields = [f.strip() for f in fields.split(',') if f.strip()]
+        invalid = [f for f in fields if f not in CREDENTIAL_API_FIELDS and f != 'has_history']
+        if invalid:
+            return jsonify({'error': f'Unknown fields: {", ".join(invalid)}'}), 400
+    else:
+        fields = list(CREDENTIAL_API_FIELDS) + ['has_history']
+    
+    columns = [CREDENTIAL_API_FIELDS[f] for f in fields if f != 'has_history']
+    if 'has_history' in fields:
+        # Correlated EXISTS keeps history presence in the same round-trip (no N+1, no second query)
+        columns.append(
+            exists().where(PasswordHistory.credential_id == Credential.id).label('has_history')
+        )
+    stmt = select(*columns).where(Credential.environment_id == env_id).order_by(Credential.id)
+    
+    paginated = 'page' in request.args or 'per_page' in request.args
+    if paginated:
+        page = max(request.args.get('page', 1, type=int) or 1, 1)
+        per_page = min(max(request.args.get('per_page', 100, type=int) or 100, 1), CREDENTIALS_MAX_PER_PAGE)
+        total = db.session.scalar(
+            select(func.count(Credential.id)).where(Credential.environment_id == env_id)
+        )
+        stmt = stmt.limit(per_page).offset((page - 1) * per_page)
+    
+    # Core rows map straight to dicts without ORM identity-map overhead
+    items = [
+        {f: bool(mapping[f]) if f == 'has_history' else mapping[f] for f in fields}
+        for mapping in db.session.execute(stmt).mappings()
+    ]
+    
+    if paginated:
+        return jsonify({'items': items, 'total': total, 'page': page, 'per_page': per_page})
+    return jsonify(items)
 
 
 @app.route('/api/credentials/<int:cred_id>/history', methods=['GET'])
 @login_required
 def api_credential_history(cred_id):
     """Get password history for a credential"""
-    credential = Credential.query.get_or_404(cred_id)
+    # Load the credential and its history (ordered newest first by the relationship) in one query
+    credential = db.session.get(Credential, cred_id, options=[joinedload(Credential.password_history)])
+    if credential is None:
+        abort(404)
     
-    # Get password history
-    history = PasswordHistory.query.filter_by(credential_id=cred_id).order_by(PasswordHistory.changed_at.desc()).all()
+    history = credential.password_history
     
     return jsonify({
         'credential': {
@@ -1947,30 +2161,48 @@ def api_credential_history(cred_id):
             'hostname': credential.hostname,
             'username': credential.username,
             'current_password': credential.password,
-            'last_updated': credential.last_updated.isoformat() if credential.last_updated else None
+            'last_updated': credential.last_updated
         },
         'history': [{
             'password': h.password,
-            'changed_at': h.changed_at.isoformat() if h.changed_at else None,
+            'changed_at': h.changed_at,
             'changed_by': h.changed_by
         } for h in history]
     })
 
 
+def _credential_export_rows(env_id):
+    """Load only the exported credential columns as Core rows (no ORM hydration)
+    
+    Rows expose the same attribute names as Credential, so the exporters accept either.
+    last_updated is formatted by SQLite's strftime, so it arrives as a string.
+    """
+    return db.session.execute(
+        select(
+            Credential.hostname,
+            Credential.username,
+            Credential.password,
+            Credential.credential_type,
+            Credential.account_type,
+            Credential.resource_type,
+            Credential.domain_name,
+            Credential.source,
+            func.strftime(DATETIME_FMT, Credential.last_updated).label('last_updated'),
+        ).where(Credential.environment_id == env_id)
+    ).all()
+
+
 @app.route('/api/environments/<int:env_id>/export/csv')
 @login_required
 def export_csv(env_id):
-    """Export credentials as CSV"""
+    """Export credentials as CSV (streamed row by row)"""
     environment = Environment.query.get_or_404(env_id)
-    credentials = Credential.query.filter_by(environment_id=env_id).all()
-    
-    csv_data = export_to_csv(credentials)
+    credentials = _credential_export_rows(env_id)
     
-    return send_file(
-        io.BytesIO(csv_data.encode('utf-8')),
+    return Response(
+        stream_with_context(iter_csv(credentials)),
         mimetype='text/csv',
-        as_attachment=True,
-        download_name=f'{environment.name}_credentials_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+        headers=_attachment_headers(f'{environment.name}_credentials_{datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)}.csv')
     )
 
 
@@ -1979,7 +2211,7 @@ def export_csv(env_id):
 def export_excel(env_id):
     """Export credentials as Excel"""
     environment = Environment.query.get_or_404(env_id)
-    credentials = Credential.query.filter_by(environment_id=env_id).all()
+    credentials = _credential_export_rows(env_id)
     
     excel_data = export_to_excel(credentials, environment.name)
     
@@ -1987,7 +2219,7 @@ def export_excel(env_id):
         io.BytesIO(excel_data),
         mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
         as_attachment=True,
-        download_name=f'{environment.name}_credentials_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
+        download_name=f'{environment.name}_credentials_{datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)}.xlsx'
     )
 
 
@@ -1996,8 +2228,6 @@ def export_excel(env_id):
 @admin_required
 def export_environment_config(env_id):
     """Export environment configuration as JSON or YAML (admin only)"""
-    import json
-    
     environment = Environment.query.get_or_404(env_id)
     format_type = request.args.get('format', 'json').lower()
     
@@ -2035,19 +2265,18 @@ def export_environment_config(env_id):
     
     app.logger.info(f"Environment config exported by {current_user.username}: {environment.name} (format: {format_type})")
     
-    if format_type == 'yaml':
-        try:
-            import yaml
-            content = yaml.dump(config, default_flow_style=False, sort_keys=False, allow_unicode=True)
-            mimetype = 'text/yaml'
-            extension = 'yaml'
-        except ImportError:
-            # Fallback to JSON if YAML not available
-            content = json.dumps(config, indent=2)
-            mimetype = 'application/json'
-            extension = 'json'
+    if format_type == 'yaml' and yaml is not None:
+        content = yaml.dump(
+            config, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False, allow_unicode=True
+        ).encode('utf-8')
+        mimetype = 'text/yaml'
+        extension = 'yaml'
     else:
-        content = json.dumps(config, indent=2)
+        # JSON (also the fallback if YAML is not available)
+        if orjson:
+            content = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            content = json.dumps(config, indent=2).encode('utf-8')
         mimetype = 'application/json'
         extension = 'json'
     
@@ -2056,10 +2285,10 @@ def export_environment_config(env_id):
     safe_name = safe_name.replace(' ', '_')
     
     return send_file(
-        io.BytesIO(content.encode('utf-8')),
+        io.BytesIO(content),
         mimetype=mimetype,
         as_attachment=True,
-        download_name=f'{safe_name}_config_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{extension}'
+        download_name=f'{safe_name}_config_{datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)}.{extension}'
     )
 
 
@@ -2077,46 +2306,23 @@ def environment_view(env_id):
 def api_ssl_info():
     """Get current SSL certificate information"""
     try:
-        import subprocess
-        
-        ssl_dir = os.path.join(os.getcwd(), 'ssl')
-        cert_path = os.path.join(ssl_dir, 'server.crt')
+        cert_path = CERT_PATH
         
-        if not os.path.exists(cert_path):
+        try:
+            mtime_ns = os.stat(cert_path).st_mtime_ns
+        except FileNotFoundError:
             return jsonify({'exists': False})
         
-        # Get certificate information
-        result = subprocess.run(
-            ['openssl', 'x509', '-in', cert_path, '-noout', '-subject', '-issuer', '-dates'],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode != 0:
+        # Parsed fields are cached until the certificate file changes
+        cert_info = _load_certificate_info(cert_path, mtime_ns)
+        if cert_info is None:
             return jsonify({'exists': False})
         
-        # Parse output
-        info = {}
-        for line in result.stdout.strip().split('\n'):
-            if line.startswith('subject='):
-                info['subject'] = line.replace('subject=', '').strip()
-            elif line.startswith('issuer='):
-                info['issuer'] = line.replace('issuer=', '').strip()
-            elif line.startswith('notBefore='):
-                info['valid_from'] = line.replace('notBefore=', '').strip()
-            elif line.startswith('notAfter='):
-                info['valid_until'] = line.replace('notAfter=', '').strip()
+        fields, not_after = cert_info
+        info = dict(fields)
         
         # Calculate days remaining
-        try:
-            from datetime import datetime
-            valid_until_str = info.get('valid_until', '')
-            if valid_until_str:
-                valid_until = datetime.strptime(valid_until_str, '%b %d %H:%M:%S %Y %Z')
-                days_remaining = (valid_until - datetime.now()).days
-                info['days_remaining'] = days_remaining
-        except:
-            info['days_remaining'] = 'N/A'
+        info['days_remaining'] = (not_after - datetime.now(timezone.utc)).days
         
         info['exists'] = True
         return jsonify(info)
@@ -2126,28 +2332,107 @@ def api_ssl_info():
         return jsonify({'exists': False, 'error': str(e)})
 
 
+@lru_cache(maxsize=1)
+def _load_certificate_info(cert_path, mtime_ns):
+    """Parse subject, issuer and validity of a PEM certificate
+    
+    Keyed on the file's mtime so a replaced certificate is re-read.
+    
+    Returns:
+        tuple: (fields: dict, not_after: aware datetime), or None if not a valid PEM certificate
+    """
+    with open(cert_path, 'rb') as f:
+        try:
+            cert = x509.load_pem_x509_certificate(f.read())
+        except ValueError:
+            return None
+    not_before = cert.not_valid_before_utc
+    not_after = cert.not_valid_after_utc
+    fields = {
+        'subject': cert.subject.rfc4514_string(),
+        'issuer': cert.issuer.rfc4514_string(),
+        'valid_from': _format_openssl_date(not_before),
+        'valid_until': _format_openssl_date(not_after),
+    }
+    return fields, not_after
+
+
+def _format_openssl_date(value):
+    """Format a datetime the way `openssl x509 -dates` prints it"""
+    return f"{value:%b} {value.day:2d} {value:%H:%M:%S %Y} GMT"
+
+
+def _generate_self_signed_certificate(hostname, ip_address, days=365):
+    """Build a self-signed RSA 4096 certificate in-process
+    
+    Mirrors the `openssl req -x509` settings previously used: CN and SANs for the
+    hostname, localhost, the host IP and 127.0.0.1, non-CA, SHA-256 signature.
+    
+    Returns:
+        tuple: (cert_pem: bytes, key_pem: bytes)
+    """
+    import ipaddress
+    from datetime import timedelta
+    
+    key = rsa.generate_private_key(public_exponent=65537, key_size=4096)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, hostname)])
+    san = x509.SubjectAlternativeName([
+        x509.DNSName(hostname),
+        x509.DNSName('localhost'),
+        x509.IPAddress(ipaddress.ip_address(ip_address)),
+        x509.IPAddress(ipaddress.ip_address('127.0.0.1')),
+    ])
+    now = datetime.now(timezone.utc)
+    
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + timedelta(days=days))
+        .add_extension(san, critical=False)
+        .add_extension(x509.BasicConstraints(ca=False, path_length=None), critical=False)
+        .add_extension(
+            x509.KeyUsage(
+                digital_signature=True, content_commitment=False, key_encipherment=True,
+                data_encipherment=False, key_agreement=False, key_cert_sign=False,
+                crl_sign=False, encipher_only=False, decipher_only=False
+            ),
+            critical=False
+        )
+        .sign(key, hashes.SHA256())
+    )
+    
+    cert_pem = cert.public_bytes(serialization.Encoding.PEM)
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption()
+    )
+    return cert_pem, key_pem
+
+
 @app.route('/api/ssl/generate', methods=['POST'])
 @login_required
 @admin_required
 def api_generate_ssl():
     """Generate a self-signed SSL certificate"""
-    import subprocess
     import socket
     
     try:
-        ssl_dir = os.path.join(os.getcwd(), 'ssl')
-        os.makedirs(ssl_dir, exist_ok=True)
+        os.makedirs(SSL_DIR, exist_ok=True)
         
-        cert_path = os.path.join(ssl_dir, 'server.crt')
-        key_path = os.path.join(ssl_dir, 'server.key')
+        cert_path = CERT_PATH
+        key_path = KEY_PATH
         
-        # Backup existing certificates
+        # Backup existing certificates; one suffix keeps the cert and key backups paired
+        backup_suffix = f".backup.{datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)}"
         if os.path.exists(cert_path):
-            backup_time = datetime.now().strftime('%Y%m%d_%H%M%S')
-            os.rename(cert_path, f"{cert_path}.backup.{backup_time}")
+            os.rename(cert_path, cert_path + backup_suffix)
         if os.path.exists(key_path):
-            backup_time = datetime.now().strftime('%Y%m%d_%H%M%S')
-            os.rename(key_path, f"{key_path}.backup.{backup_time}")
+            os.rename(key_path, key_path + backup_suffix)
         
         # Get hostname and IP for SAN
         hostname = socket.gethostname()
@@ -2156,46 +2441,13 @@ def api_generate_ssl():
         except:
             ip_address = '127.0.0.1'
         
-        # Create OpenSSL config for SAN
-        config_content = f"""[req]
-default_bits = 4096
-prompt = no
-default_md = sha256
-distinguished_name = dn
-x509_extensions = v3_req
-
-[dn]
-CN = {hostname}
-
-[v3_req]
-subjectAltName = @alt_names
-basicConstraints = CA:FALSE
-keyUsage = digitalSignature, keyEncipherment
-
-[alt_names]
-DNS.1 = {hostname}
-DNS.2 = localhost
-IP.1 = {ip_address}
-IP.2 = 127.0.0.1
-"""
-        
-        config_path = os.path.join(ssl_dir, 'openssl.cnf')
-        with open(config_path, 'w') as f:
-            f.write(config_content)
-        
-        # Generate certificate
-        result = subprocess.run([
-            'openssl', 'req', '-x509', '-newkey', 'rsa:4096', '-nodes',
-            '-keyout', key_path,
-            '-out', cert_path,
-            '-days', '365',
-            '-config', config_path,
-            '-extensions', 'v3_req'
-        ], capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            app.logger.error(f"OpenSSL error: {result.stderr}")
-            return jsonify({'error': 'Failed to generate certificate', 'details': result.stderr}), 500
+        # Generate key and certificate in-process, no config file or fork needed
+        cert_pem, key_pem = _generate_self_signed_certificate(hostname, ip_address)
+        # Create the key owner-only from the start rather than chmod after writing
+        with os.fdopen(os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            f.write(key_pem)
+        with open(cert_path, 'wb') as f:
+            f.write(cert_pem)
         
         # Set proper permissions
         os.chmod(cert_path, 0o644)
@@ -2233,34 +2485,32 @@ def api_storage_info():
         result = {}
         
         # Database info
-        db_path = os.path.join(os.getcwd(), 'instance', 'vcf_credentials.db')
-        if os.path.exists(db_path):
-            db_size = os.path.getsize(db_path)
-            result['database_size'] = _format_file_size(db_size)
-            result['database_path'] = 'instance/'
-        else:
+        db_path = DB_PATH
+        result['database_path'] = 'instance/'
+        try:
+            result['database_size'] = _format_file_size(os.stat(db_path).st_size)
+        except FileNotFoundError:
             result['database_size'] = 'N/A'
-            result['database_path'] = 'instance/'
         
-        # Log files info
-        logs_dir = os.path.join(os.getcwd(), 'logs')
-        if os.path.exists(logs_dir):
+        # Log files info (DirEntry caches stat results, one syscall per file)
+        logs_dir = LOGS_DIR
+        try:
             total_log_size = 0
             log_count = 0
-            for filename in os.listdir(logs_dir):
-                filepath = os.path.join(logs_dir, filename)
-                if os.path.isfile(filepath):
-                    total_log_size += os.path.getsize(filepath)
-                    log_count += 1
+            with os.scandir(logs_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        total_log_size += entry.stat().st_size
+                        log_count += 1
             result['logs_size'] = _format_file_size(total_log_size)
             result['logs_count'] = log_count
-        else:
+        except FileNotFoundError:
             result['logs_size'] = 'N/A'
             result['logs_count'] = 0
         
         # Disk space info
         try:
-            disk_usage = shutil.disk_usage(os.getcwd())
+            disk_usage = shutil.disk_usage(BASE_DIR)
             result['disk_total'] = disk_usage.total
             result['disk_total_human'] = _format_file_size(disk_usage.total)
             result['disk_free'] = _format_file_size(disk_usage.free)
@@ -2293,7 +2543,7 @@ def api_restart_server():
         app.logger.debug(f"Current process PID: {current_pid}")
         
         # Method 1: Check for PID file (most reliable)
-        pid_file = 'gunicorn.pid'
+        pid_file = GUNICORN_PID_FILE
         gunicorn_pid = None
         
         if os.path.exists(pid_file):
@@ -2407,37 +2657,120 @@ def logs_view():
 @admin_required
 def api_logs():
     """Get list of available log files (admin only)"""
-    import glob
-    
-    logs_dir = os.path.join(os.getcwd(), 'logs')
+    logs_dir = LOGS_DIR
     if not os.path.exists(logs_dir):
         return jsonify({'logs': []})
     
-    log_files = []
-    for log_path in glob.glob(os.path.join(logs_dir, '*.log*')):
-        filename = os.path.basename(log_path)
-        stat = os.stat(log_path)
-        log_files.append({
-            'name': filename,
-            'size': stat.st_size,
-            'size_human': _format_file_size(stat.st_size),
-            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            'modified_human': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-        })
-    
-    # Sort by modification time (newest first)
-    log_files.sort(key=lambda x: x['modified'], reverse=True)
+    # Collect (mtime, name, size) tuples in one pass; tuple ordering sorts newest first.
+    # A plain substring test matches what the '*.log*' glob did, including rotated files
+    entries = []
+    with os.scandir(logs_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name[0] == '.' or '.log' not in name or not entry.is_file():
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, name, stat.st_size))
+    entries.sort(reverse=True)
+    
+    # Clients format 'modified' for display themselves
+    fromtimestamp = datetime.fromtimestamp
+    log_files = [{
+        'name': name,
+        'size': size,
+        'size_human': _format_file_size(size),
+        'modified': fromtimestamp(mtime).isoformat()
+    } for mtime, name, size in entries]
     
     return jsonify({'logs': log_files})
 
 
+class _ChunkBuffer:
+    """Write-only file object that collects bytes until they are drained"""
+    
+    def __init__(self):
+        self._chunks = []
+    
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _attachment_headers(filename):
+    """Build Content-Disposition headers for a streamed download"""
+    try:
+        filename.encode('ascii')
+        disposition = f'attachment; filename="{filename}"'
+    except UnicodeEncodeError:
+        disposition = f"attachment; filename*=UTF-8''{quote(filename, safe='')}"
+    return {'Content-Disposition': disposition}
+
+
+LOG_TAIL_CHUNK_SIZE = 64 * 1024
+
+
+def _tail_file(path, max_lines):
+    """Return the last lines of a text file without reading the whole file
+    
+    Reads fixed-size blocks backwards from the end until enough newlines
+    have been seen. The total line count is exact when the scan reaches the
+    start of the file, otherwise it is estimated from the average line length.
+    
+    Returns:
+        tuple: (content: str, showing_lines: int, total_lines: int, total_is_estimate: bool)
+    """
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        pos = size
+        blocks = []
+        newlines = 0
+        # One extra newline is needed to find the start of the oldest wanted line
+        while pos > 0 and newlines <= max_lines:
+            read_size = min(LOG_TAIL_CHUNK_SIZE, pos)
+            pos -= read_size
+            f.seek(pos)
+            block = f.read(read_size)
+            blocks.append(block)
+            newlines += block.count(b'\n')
+    
+    data = b''.join(reversed(blocks))
+    trailing_newline = data.endswith(b'\n')
+    all_lines = data.split(b'\n') if data else []
+    if trailing_newline:
+        all_lines.pop()
+    if pos > 0:
+        # The first element is a partial line cut by the block boundary
+        all_lines = all_lines[1:]
+    
+    tail = all_lines[-max_lines:]
+    content = b'\n'.join(tail)
+    if tail and trailing_newline:
+        content += b'\n'
+    
+    if pos == 0:
+        total_lines, total_is_estimate = len(all_lines), False
+    else:
+        sample_bytes = sum(len(line) + 1 for line in all_lines)
+        total_lines = round(size / (sample_bytes / len(all_lines))) if all_lines else 0
+        total_is_estimate = True
+    
+    text = content.decode('utf-8', errors='replace').replace('\r\n', '\n')
+    return text, len(tail), total_lines, total_is_estimate
+
+
+FILE_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def _format_file_size(size_bytes):
     """Format file size in human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    # Each unit is a factor of 2**10, so the unit index follows from the bit length
+    idx = min(max(0, (int(size_bytes).bit_length() - 1) // 10), len(FILE_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {FILE_SIZE_UNITS[idx]}"
 
 
 @app.route('/api/logs/<path:filename>')
@@ -2445,17 +2778,13 @@ def _format_file_size(size_bytes):
 @admin_required
 def api_log_content(filename):
     """Get content of a specific log file (admin only)"""
-    import re
-    
     # Security: only allow .log files from logs directory
-    if not re.match(r'^[\w\-\.]+\.log(\.\d+)?$', filename):
+    if not LOG_FILENAME_PATTERN.match(filename):
         return jsonify({'error': 'Invalid filename'}), 400
     
-    logs_dir = os.path.join(os.getcwd(), 'logs')
-    log_path = os.path.join(logs_dir, filename)
-    
-    # Prevent directory traversal
-    if not os.path.abspath(log_path).startswith(os.path.abspath(logs_dir)):
+    # Prevent directory traversal, including symlinks that resolve outside the logs directory
+    log_path = os.path.realpath(os.path.join(LOGS_DIR_REAL, filename))
+    if log_path == LOGS_DIR_REAL or os.path.commonpath((log_path, LOGS_DIR_REAL)) != LOGS_DIR_REAL:
         return jsonify({'error': 'Invalid path'}), 400
     
     if not os.path.exists(log_path):
@@ -2463,14 +2792,11 @@ def api_log_content(filename):
     
     # Get optional parameters
     lines = request.args.get('lines', 500, type=int)
-    lines = min(lines, 5000)  # Cap at 5000 lines
+    lines = max(1, min(lines, 5000))  # Cap at 5000 lines
     
     try:
-        with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
-            # Read last N lines
-            all_lines = f.readlines()
-            content = ''.join(all_lines[-lines:])
-            total_lines = len(all_lines)
+        # Read only the last N lines, scanning backwards from the end of the file
+        content, showing_lines, total_lines, total_is_estimate = _tail_file(log_path, lines)
         
         log_user_access(current_user.username, 'READ_LOG', f"file={filename}")
         
@@ -2478,7 +2804,8 @@ def api_log_content(filename):
             'filename': filename,
             'content': content,
             'total_lines': total_lines,
-            'showing_lines': min(lines, total_lines)
+            'total_lines_estimated': total_is_estimate,
+            'showing_lines': showing_lines
         })
     except Exception as e:
         app.logger.error(f"Error reading log file {filename}: {e}")
@@ -2491,34 +2818,78 @@ def api_log_content(filename):
 def api_export_logs():
     """Export all log files as tar.gz archive (admin only)"""
     import tarfile
-    import tempfile
     
-    logs_dir = os.path.join(os.getcwd(), 'logs')
+    logs_dir = LOGS_DIR
     if not os.path.exists(logs_dir):
         return jsonify({'error': 'No logs directory found'}), 404
     
     try:
-        # Create tar.gz in memory
-        output = io.BytesIO()
-        
-        with tarfile.open(fileobj=output, mode='w:gz') as tar:
-            for filename in os.listdir(logs_dir):
-                if filename.endswith('.log') or '.log.' in filename:
-                    file_path = os.path.join(logs_dir, filename)
-                    if os.path.isfile(file_path):
-                        tar.add(file_path, arcname=filename)
-        
-        output.seek(0)
+        log_files = []
+        with os.scandir(logs_dir) as entries:
+            for entry in entries:
+                if (entry.name.endswith('.log') or '.log.' in entry.name) and entry.is_file():
+                    log_files.append((entry.name, entry.path))
+        
+        def generate():
+            # Streaming tar mode ('w|gz') never seeks, so compressed output is sent after
+            # every copied block and memory stays bounded by LOG_EXPORT_BLOCK_SIZE
+            buffer = _ChunkBuffer()
+            with tarfile.open(fileobj=buffer, mode='w|gz') as tar:
+                for filename, file_path in log_files:
+                    # Open and stat the file before its header is written, so a file that
+                    # can't be opened is skipped instead of truncating the archive
+                    try:
+                        f = open(file_path, 'rb')
+                    except OSError as e:
+                        app.logger.warning(f"Skipping log file {filename} in export: {e}")
+                        continue
+                    
+                    with f:
+                        info = tar.gettarinfo(arcname=filename, fileobj=f)
+                        header = info.tobuf(tar.format, tar.encoding, tar.errors)
+                        tar.fileobj.write(header)
+                        tar.offset += len(header)
+                        
+                        # Copy exactly info.size bytes block by block: a log that grows is cut
+                        # off at its stat size, one that shrinks or fails mid-read is zero-padded
+                        remaining = info.size
+                        exhausted = False
+                        while remaining:
+                            size = min(LOG_EXPORT_BLOCK_SIZE, remaining)
+                            block = b''
+                            if not exhausted:
+                                try:
+                                    block = f.read(size)
+                                except OSError as e:
+                                    app.logger.warning(f"Log file {filename} truncated in export: {e}")
+                                if len(block) < size:
+                                    exhausted = True
+                                    block += tarfile.NUL * (size - len(block))
+                            else:
+                                block = tarfile.NUL * size
+                            tar.fileobj.write(block)
+                            remaining -= size
+                            
+                            chunk = buffer.drain()
+                            if chunk:
+                                yield chunk
+                    
+                    blocks, remainder = divmod(info.size, tarfile.BLOCKSIZE)
+                    if remainder:
+                        tar.fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+                        blocks += 1
+                    tar.offset += blocks * tarfile.BLOCKSIZE
+                    tar.members.append(info)
+            yield buffer.drain()
         
         log_user_access(current_user.username, 'EXPORT_LOGS', 'format=tar.gz')
         app.logger.info(f"Admin {current_user.username} exported log files")
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        return send_file(
-            output,
+        timestamp = datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)
+        return Response(
+            stream_with_context(generate()),
             mimetype='application/gzip',
-            as_attachment=True,
-            download_name=f'vcf_credentials_logs_{timestamp}.tar.gz'
+            headers=_attachment_headers(f'vcf_credentials_logs_{timestamp}.tar.gz')
         )
     except Exception as e:
         app.logger.error(f"Error exporting logs: {e}")
@@ -2530,17 +2901,13 @@ def api_export_logs():
 @admin_required
 def api_download_log(filename):
     """Download a specific log file (admin only)"""
-    import re
-    
     # Security: only allow .log files from logs directory
-    if not re.match(r'^[\w\-\.]+\.log(\.\d+)?$', filename):
+    if not LOG_FILENAME_PATTERN.match(filename):
         return jsonify({'error': 'Invalid filename'}), 400
     
-    logs_dir = os.path.join(os.getcwd(), 'logs')
-    log_path = os.path.join(logs_dir, filename)
-    
-    # Prevent directory traversal
-    if not os.path.abspath(log_path).startswith(os.path.abspath(logs_dir)):
+    # Prevent directory traversal, including symlinks that resolve outside the logs directory
+    log_path = os.path.realpath(os.path.join(LOGS_DIR_REAL, filename))
+    if log_path == LOGS_DIR_REAL or os.path.commonpath((log_path, LOGS_DIR_REAL)) != LOGS_DIR_REAL:
         return jsonify({'error': 'Invalid path'}), 400
     
     if not os.path.exists(log_path):
@@ -2548,11 +2915,21 @@ def api_download_log(filename):
     
     log_user_access(current_user.username, 'DOWNLOAD_LOG', f"file={filename}")
     
+    # Behind Nginx, hand the transfer to the proxy so no bytes pass through Python
+    if request.headers.get('X-Sendfile-Type') == 'X-Accel-Redirect':
+        headers = _attachment_headers(filename)
+        headers['X-Accel-Redirect'] = LOGS_ACCEL_REDIRECT_PREFIX + quote(filename)
+        return Response(mimetype='text/plain', headers=headers)
+    
+    # Conditional responses let clients revalidate; Gunicorn serves the file with sendfile(2)
     return send_file(
         log_path,
         mimetype='text/plain',
         as_attachment=True,
-        download_name=filename
+        download_name=filename,
+        conditional=True,
+        etag=True,
+        last_modified=os.path.getmtime(log_path)
     )
 
 
@@ -2576,7 +2953,7 @@ def create_admin():
     
     admin = User(
         username=username,
-        password_hash=generate_password_hash(password),
+        password_hash=hash_password(password),
         is_admin=True
     )
     
@@ -2593,7 +2970,7 @@ if __name__ == '__main__':
         if User.query.count() == 0:
             admin = User(
                 username='admin',
-                password_hash=generate_password_hash('admin'),
+                password_hash=hash_password('admin'),
                 is_admin=True
             )
             db.session.add(admin)
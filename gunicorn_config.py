@@ -10,19 +10,32 @@ bind = "0.0.0.0:5000"
 backlog = 2048
 
 # Worker processes
-# Start with 1 worker to avoid database initialization race conditions
-# Can be increased after first run: workers = multiprocessing.cpu_count() * 2 + 1
-workers = 1
+# Defaults to 1 worker: each worker runs its own BackgroundScheduler, so extra
+# workers would run every scheduled sync once per worker and the scheduler
+# pages would only see the jobs of whichever worker answers the request.
+# Override with GUNICORN_WORKERS (e.g. multiprocessing.cpu_count() * 2 + 1) only
+# when scheduled syncs are disabled.
+workers = int(os.getenv('GUNICORN_WORKERS', '1'))
 worker_class = 'sync'
 worker_connections = 1000
 timeout = 30
+graceful_timeout = 30
 keepalive = 2
 
+# Recycle workers periodically to bound memory growth; the jitter keeps
+# several workers from restarting at the same moment
+max_requests = 100_000
+max_requests_jitter = 1_000
+# Let sync workers send file responses with sendfile(2) (disabled by Gunicorn under TLS)
+sendfile = True
+
 # Logging
-accesslog = 'logs/gunicorn_access.log'
+# The HTTP access log is opt-in: set GUNICORN_ACCESS_LOG (e.g. logs/gunicorn_access.log)
+# to enable it. User actions are already recorded in logs/user_access.log by the app.
+accesslog = os.getenv('GUNICORN_ACCESS_LOG') or None
 errorlog = 'logs/gunicorn_error.log'
 loglevel = 'info'
-access_log_format = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s"'
+access_log_format = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s'
 
 # Process naming
 proc_name = 'vcf_credentials_manager'
@@ -343,7 +343,6 @@ exec pipenv run gunicorn \
     --certfile ssl/cert.pem \
     --keyfile ssl/key.pem \
     --pid gunicorn.pid \
-    --access-logfile logs/gunicorn_access.log \
     --error-logfile logs/gunicorn_error.log \
     app:app
 EOF
@@ -4,11 +4,17 @@ Database models for VCF Credentials Fetch application
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
+from sqlalchemy import func
 from datetime import datetime, timezone
 
 db = SQLAlchemy()
 
 
+def utcnow():
+    """Timezone-aware current UTC time, used for column defaults"""
+    return datetime.now(timezone.utc)
+
+
 class User(UserMixin, db.Model):
     """User model for authentication"""
     __tablename__ = 'users'
@@ -18,7 +24,7 @@ class User(UserMixin, db.Model):
     password_hash = db.Column(db.String(255), nullable=False)
     is_admin = db.Column(db.Boolean, default=False)
     role = db.Column(db.String(20), default='admin')  # 'admin' or 'readonly'
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = db.Column(db.DateTime(timezone=True), default=utcnow, server_default=func.now())
     
     def __repr__(self):
         return f'<User {self.username}>'
@@ -62,19 +68,31 @@ class Environment(db.Model):
     sync_enabled = db.Column(db.Boolean, default=False)
     sync_interval_minutes = db.Column(db.Integer, default=60)
     
-    last_sync = db.Column(db.DateTime)
+    last_sync = db.Column(db.DateTime(timezone=True))
     
     # Sync status tracking
     last_sync_status = db.Column(db.String(20), default='never')  # 'success', 'partial', 'failed', 'never'
     installer_error = db.Column(db.Text)  # Error message for installer connection
     manager_error = db.Column(db.Text)  # Error message for manager connection
     
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime(timezone=True), default=utcnow, server_default=func.now())
+    updated_at = db.Column(db.DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow)
     
     # Relationships
     credentials = db.relationship('Credential', backref='environment', lazy=True, cascade='all, delete-orphan')
     
+    @property
+    def sync_schedule_fingerprint(self):
+        """Hash of the fields that determine the scheduled sync jobs"""
+        return hash((
+            self.installer_sync_enabled,
+            self.installer_sync_interval_minutes,
+            self.manager_sync_enabled,
+            self.manager_sync_interval_minutes,
+            self.installer_host,
+            self.manager_host,
+        ))
+    
     def __repr__(self):
         return f'<Environment {self.name}>'
 
@@ -85,6 +103,8 @@ class Credential(db.Model):
     __table_args__ = (
         db.UniqueConstraint('environment_id', 'hostname', 'credential_type', 'username', 'source',
                            name='uq_credential_identity'),
+        # Per-environment (and per-source) lookups used by syncs, listings and exports
+        db.Index('ix_credentials_environment_source', 'environment_id', 'source'),
     )
     
     id = db.Column(db.Integer, primary_key=True)
@@ -102,7 +122,7 @@ class Credential(db.Model):
     domain_name = db.Column(db.String(100))
     source = db.Column(db.String(50), default='SDDC_MANAGER')  # VCF_INSTALLER or SDDC_MANAGER
     
-    last_updated = db.Column(db.DateTime, default=datetime.utcnow)
+    last_updated = db.Column(db.DateTime(timezone=True), default=utcnow, server_default=func.now())
     
     # Relationships
     password_history = db.relationship('PasswordHistory', backref='credential', lazy=True, cascade='all, delete-orphan', order_by='PasswordHistory.changed_at.desc()')
@@ -114,12 +134,16 @@ class Credential(db.Model):
 class PasswordHistory(db.Model):
     """Password history for tracking credential changes"""
     __tablename__ = 'password_history'
+    __table_args__ = (
+        # Serves history lookups ordered by changed_at and the has_history EXISTS check
+        db.Index('ix_password_history_credential_changed', 'credential_id', 'changed_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     credential_id = db.Column(db.Integer, db.ForeignKey('credentials.id'), nullable=False)
     
     password = db.Column(db.String(255), nullable=False)
-    changed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    changed_at = db.Column(db.DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False)
     changed_by = db.Column(db.String(50), default='SYSTEM')  # SYSTEM, SYNC, MANUAL
     
     def __repr__(self):
@@ -135,11 +159,11 @@ class ScheduleConfig(db.Model):
     
     enabled = db.Column(db.Boolean, default=True)
     interval_minutes = db.Column(db.Integer, default=60)
-    last_run = db.Column(db.DateTime)
-    next_run = db.Column(db.DateTime)
+    last_run = db.Column(db.DateTime(timezone=True))
+    next_run = db.Column(db.DateTime(timezone=True))
     
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime(timezone=True), default=utcnow, server_default=func.now())
+    updated_at = db.Column(db.DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow)
     
     def __repr__(self):
         return f'<ScheduleConfig env={self.environment_id} interval={self.interval_minutes}m>'
@@ -1,7 +1,7 @@
 """Web Application Services"""
 
 from .vcf_fetcher import VCFCredentialFetcher
-from .export_utils import export_to_csv, export_to_excel
+from .export_utils import export_to_csv, export_to_excel, iter_csv
 
-__all__ = ['VCFCredentialFetcher', 'export_to_csv', 'export_to_excel']
+__all__ = ['VCFCredentialFetcher', 'export_to_csv', 'export_to_excel', 'iter_csv']
 
@@ -4,94 +4,117 @@ Export utilities for CSV and Excel formats
 
 import csv
 import io
-from typing import List
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, List
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 
 
-def export_to_csv(credentials: List) -> str:
-    """Export credentials to CSV format"""
-    output = io.StringIO()
+# Column headers shared by the CSV and Excel exports
+EXPORT_HEADERS = (
+    'Hostname',
+    'Username',
+    'Password',
+    'Credential Type',
+    'Account Type',
+    'Resource Type',
+    'Domain Name',
+    'Source',
+    'Last Updated'
+)
+
+DATETIME_FMT = '%Y-%m-%d %H:%M:%S'
+
+# Rows formatted per streamed CSV chunk
+CSV_CHUNK_ROWS = 256
+
+# Excel header styles and column widths, shared across exports
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="0070C0", end_color="0070C0", fill_type="solid")
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+EXCEL_COLUMN_WIDTHS = (25, 30, 30, 18, 18, 18, 20, 18, 20)
+
+
+def _credential_row(cred) -> tuple:
+    """Positional export row for a credential, in EXPORT_HEADERS order
     
-    fieldnames = [
-        'Hostname',
-        'Username',
-        'Password',
-        'Credential Type',
-        'Account Type',
-        'Resource Type',
-        'Domain Name',
-        'Source',
-        'Last Updated'
-    ]
+    last_updated may be a datetime or a string already formatted by the query.
+    """
+    last_updated = cred.last_updated
+    if isinstance(last_updated, datetime):
+        last_updated = last_updated.strftime(DATETIME_FMT)
+    return (
+        cred.hostname or '',
+        cred.username or '',
+        cred.password or '',
+        cred.credential_type or '',
+        cred.account_type or '',
+        cred.resource_type or '',
+        cred.domain_name or '',
+        cred.source or 'SDDC_MANAGER',
+        last_updated or ''
+    )
+
+
+def iter_csv(credentials: Iterable) -> Iterator[str]:
+    """Yield credentials as CSV text in chunks of CSV_CHUNK_ROWS rows
     
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
+    Only one chunk is buffered at a time, so memory stays flat regardless
+    of the number of credentials.
+    """
+    output = io.StringIO()
     
-    for cred in credentials:
-        writer.writerow({
-            'Hostname': cred.hostname or '',
-            'Username': cred.username or '',
-            'Password': cred.password or '',
-            'Credential Type': cred.credential_type or '',
-            'Account Type': cred.account_type or '',
-            'Resource Type': cred.resource_type or '',
-            'Domain Name': cred.domain_name or '',
-            'Source': cred.source or 'SDDC_MANAGER',
-            'Last Updated': cred.last_updated.strftime('%Y-%m-%d %H:%M:%S') if cred.last_updated else ''
-        })
+    writer = csv.writer(output)
+    writer.writerow(EXPORT_HEADERS)
     
-    return output.getvalue()
+    rows = map(_credential_row, credentials)
+    while True:
+        batch = list(islice(rows, CSV_CHUNK_ROWS))
+        if not batch:
+            break
+        writer.writerows(batch)
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate()
+    
+    remaining = output.getvalue()
+    if remaining:
+        yield remaining
+
+
+def export_to_csv(credentials: List) -> str:
+    """Export credentials to CSV format"""
+    return ''.join(iter_csv(credentials))
 
 
 def export_to_excel(credentials: List, environment_name: str) -> bytes:
-    """Export credentials to Excel format with formatting"""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Credentials"
+    """Export credentials to Excel format with formatting
     
-    # Define styles
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="0070C0", end_color="0070C0", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center")
+    Uses a write-only workbook so rows are serialized as they are appended
+    instead of being held as a grid of cell objects.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Credentials")
     
-    # Headers
-    headers = [
-        'Hostname',
-        'Username',
-        'Password',
-        'Credential Type',
-        'Account Type',
-        'Resource Type',
-        'Domain Name',
-        'Source',
-        'Last Updated'
-    ]
+    # Column widths must be set before the first row is written
+    for col_num, width in enumerate(EXCEL_COLUMN_WIDTHS, 1):
+        ws.column_dimensions[chr(64 + col_num)].width = width
     
     # Write headers with styling
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_num)
-        cell.value = header
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
+    header_cells = []
+    for header in EXPORT_HEADERS:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = HEADER_ALIGNMENT
+        header_cells.append(cell)
+    ws.append(header_cells)
     
     # Write data
-    for row_num, cred in enumerate(credentials, 2):
-        ws.cell(row=row_num, column=1, value=cred.hostname or '')
-        ws.cell(row=row_num, column=2, value=cred.username or '')
-        ws.cell(row=row_num, column=3, value=cred.password or '')
-        ws.cell(row=row_num, column=4, value=cred.credential_type or '')
-        ws.cell(row=row_num, column=5, value=cred.account_type or '')
-        ws.cell(row=row_num, column=6, value=cred.resource_type or '')
-        ws.cell(row=row_num, column=7, value=cred.domain_name or '')
-        ws.cell(row=row_num, column=8, value=cred.source or 'SDDC_MANAGER')
-        ws.cell(row=row_num, column=9, value=cred.last_updated.strftime('%Y-%m-%d %H:%M:%S') if cred.last_updated else '')
-    
-    # Adjust column widths
-    column_widths = [25, 30, 30, 18, 18, 18, 20, 18, 20]
-    for col_num, width in enumerate(column_widths, 1):
-        ws.column_dimensions[chr(64 + col_num)].width = width
+    for cred in credentials:
+        ws.append(_credential_row(cred))
     
     # Save to bytes
     output = io.BytesIO()
@@ -99,4 +122,3 @@ def export_to_excel(credentials: List, environment_name: str) -> bytes:
     output.seek(0)
     
     return output.getvalue()
-
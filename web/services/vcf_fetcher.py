@@ -3,27 +3,316 @@ VCF Credential Fetcher
 Handles fetching credentials from VCF Installer and SDDC Manager
 """
 
+import hashlib
+import json
 import requests
 import urllib3
 import logging
-from typing import List, Dict
+import threading
+import time
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Tuple, Iterator
+
+# Optional fast JSON parser (falls back to the standard library)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent SDDC spec requests per installer
+SPEC_FETCH_WORKERS = 16
+
+# How long a bearer token is reused before logging in again (VCF tokens live ~30 minutes)
+TOKEN_TTL_SECONDS = 20 * 60
+
+# Shared read-only stand-in for a missing nested object
+_EMPTY = MappingProxyType({})
+
+
+def _credential_key(cred: Dict) -> Tuple[str, str, str, str]:
+    """Identity of a credential: the same fields the database treats as unique"""
+    return (cred['hostname'], cred['credentialType'], cred['username'], cred['source'])
+
+
+def _template(credential_type: str, account_type: str, resource_type: str) -> MappingProxyType:
+    """Read-only fields shared by every installer credential of one kind"""
+    return MappingProxyType({
+        'credentialType': credential_type,
+        'accountType': account_type,
+        'resourceType': resource_type,
+        'source': 'VCF_INSTALLER'
+    })
+
+
+# Shared, read-only field sets for each kind of installer credential
+_TEMPLATES = {
+    'ESXI_SSH': _template('SSH', 'USER', 'ESXI'),
+    'VCENTER_SSH': _template('SSH', 'USER', 'VCENTER'),
+    'VCENTER_SSO': _template('SSO', 'SERVICE', 'VCENTER'),
+    'NSX_MANAGER_SSH': _template('SSH', 'USER', 'NSX_MANAGER'),
+    'NSX_MANAGER_API': _template('API', 'SERVICE', 'NSX_MANAGER'),
+    'NSX_VIP_SSH': _template('SSH', 'USER', 'NSX_VIP'),
+    'NSX_VIP_API': _template('API', 'SERVICE', 'NSX_VIP'),
+    'SDDC_MANAGER_SSH': _template('SSH', 'USER', 'SDDC_MANAGER'),
+    'SDDC_MANAGER_SSH_SERVICE': _template('SSH', 'SERVICE', 'SDDC_MANAGER'),
+    'SDDC_MANAGER_API': _template('API', 'SERVICE', 'SDDC_MANAGER'),
+    'ARIA_OPERATIONS_API': _template('API', 'SERVICE', 'ARIA_OPERATIONS'),
+    'ARIA_OPERATIONS_NODE_SSH': _template('SSH', 'USER', 'ARIA_OPERATIONS'),
+    'ARIA_NETWORKS_SSH': _template('SSH', 'USER', 'ARIA_OPERATIONS_NETWORKS'),
+    'ARIA_NETWORKS_API': _template('API', 'SERVICE', 'ARIA_OPERATIONS_NETWORKS'),
+    'ARIA_LOGS_SSH': _template('SSH', 'USER', 'ARIA_OPERATIONS_LOGS'),
+}
+
+
+def _mk(template: str, hostname: str, username: str, password: str) -> Dict:
+    """Build a credential dict from a _TEMPLATES entry"""
+    return {**_TEMPLATES[template], 'hostname': hostname, 'username': username, 'password': password}
+
+
+@lru_cache(maxsize=64)
+def _sso_admin_username(sso_domain: str) -> str:
+    """SSO administrator account name for a vCenter SSO domain"""
+    return f"administrator@{sso_domain}"
+
+
+@lru_cache(maxsize=64)
+def _aria_node_resource_type(node_type: str) -> str:
+    """Resource type for an Aria Operations node of the given type"""
+    return f'ARIA_OPERATIONS_{node_type.upper()}'
+
+
+# hostSpecs fields read per host; a hostname key that is present always wins over the IP
+_MISSING = object()
+_HOST_DEFAULTS = {'hostname': _MISSING, 'ipAddress': '', 'credentials': None}
+_host_fields = itemgetter('hostname', 'ipAddress', 'credentials')
+
+
+def _parse_hosts(host_specs: List[Dict]) -> List[Dict]:
+    """ESXi host credentials from hostSpecs"""
+    credentials = []
+    for host in host_specs:
+        hostname = ''
+        try:
+            hostname, ip_address, creds_data = _host_fields({**_HOST_DEFAULTS, **host})
+            if hostname is _MISSING:
+                hostname = ip_address
+            
+            # Credentials is a dictionary object (not a list)
+            if isinstance(creds_data, dict):
+                host_password = creds_data.get('password')
+                if host_password:
+                    credentials.append(_mk('ESXI_SSH', hostname, creds_data.get('username', ''), host_password))
+        except Exception as e:
+            logger.warning(f"Error parsing ESXi host credentials for {hostname}: {type(e).__name__}: {e}")
+            continue
+    return credentials
+
+
+def _parse_vcenter(vcenter: Dict) -> List[Dict]:
+    """vCenter root and SSO administrator credentials from vcenterSpec"""
+    credentials = []
+    hostname = vcenter.get('vcenterHostname', vcenter.get('hostname', ''))
+    sso_domain = vcenter.get('ssoDomain', 'vsphere.local')
+    
+    # Root password
+    root_password = vcenter.get('rootVcenterPassword')
+    if root_password:
+        credentials.append(_mk('VCENTER_SSH', hostname, 'root', root_password))
+    
+    # SSO Admin password
+    sso_password = vcenter.get('adminUserSsoPassword')
+    if sso_password:
+        credentials.append(_mk('VCENTER_SSO', hostname, _sso_admin_username(sso_domain), sso_password))
+    return credentials
+
+
+# Accounts shared by every NSX Manager node and the VIP: (username, spec key, access)
+_NSX_ACCOUNTS = (
+    ('root', 'rootNsxtManagerPassword', 'SSH'),
+    ('admin', 'nsxtAdminPassword', 'API'),
+    ('audit', 'nsxtAuditPassword', 'API'),
+)
+
+
+def _nsx_accounts(nsxt: Dict) -> Iterator[Tuple[str, str, str]]:
+    """(username, password, access) for each shared NSX account that has a password"""
+    for username, key, access in _NSX_ACCOUNTS:
+        password = nsxt.get(key)
+        if password:
+            yield username, password, access
+
+
+def _parse_nsxt(nsxt: Dict) -> List[Dict]:
+    """NSX Manager node and VIP credentials from nsxtSpec"""
+    # NSX Manager nodes, then the VIP if available
+    targets = []
+    for manager in nsxt.get('nsxtManagers', []):
+        hostname = ''
+        try:
+            hostname = manager.get('hostname', manager.get('name', ''))
+            targets.append((hostname, 'NSX_MANAGER'))
+        except Exception as e:
+            logger.warning(f"Error parsing NSX manager credentials for {hostname}: {type(e).__name__}: {e}")
+            continue
+    
+    vip_fqdn = nsxt.get('vipFqdn', '')
+    if vip_fqdn:
+        targets.append((vip_fqdn, 'NSX_VIP'))
+    
+    accounts = tuple(_nsx_accounts(nsxt))
+    return [
+        _mk(f'{resource}_{access}', hostname, username, password)
+        for hostname, resource in targets
+        for username, password, access in accounts
+    ]
+
+
+def _parse_sddc_manager(manager: Dict) -> List[Dict]:
+    """SDDC Manager root, admin@local and vcf credentials from sddcManagerSpec"""
+    credentials = []
+    hostname = manager.get('hostname', '')
+    
+    # Root password
+    root_password = manager.get('rootPassword')
+    if root_password:
+        credentials.append(_mk('SDDC_MANAGER_SSH', hostname, 'root', root_password))
+    
+    local_password = manager.get('localUserPassword')
+    if local_password:
+        # Admin@local user (UI/API access) and vcf user (SSH access)
+        credentials.append(_mk('SDDC_MANAGER_API', hostname, 'admin@local', local_password))
+        credentials.append(_mk('SDDC_MANAGER_SSH_SERVICE', hostname, 'vcf', local_password))
+    
+    # SSH password (if different from localUserPassword)
+    ssh_password = manager.get('sshPassword')
+    if ssh_password and ssh_password != local_password:
+        credentials.append(_mk('SDDC_MANAGER_SSH_SERVICE', hostname, 'vcf', ssh_password))
+    return credentials
+
+
+def _parse_vcf_operations(ops_spec: Dict) -> List[Dict]:
+    """VCF Operations (Aria Operations) admin and node root credentials from vcfOperationsSpec"""
+    credentials = []
+    load_balancer_fqdn = ops_spec.get('loadBalancerFqdn', '')
+    
+    # Admin user password (for UI/API access)
+    admin_password = ops_spec.get('adminUserPassword')
+    if admin_password and load_balancer_fqdn:
+        credentials.append(_mk('ARIA_OPERATIONS_API', load_balancer_fqdn, 'admin', admin_password))
+    
+    # Node-specific root passwords
+    for node in ops_spec.get('nodes', []):
+        node_hostname = ''
+        try:
+            node_hostname = node.get('hostname', '')
+            node_type = node.get('type', 'unknown')
+            
+            node_password = node.get('rootUserPassword')
+            if node_password:
+                cred = _mk('ARIA_OPERATIONS_NODE_SSH', node_hostname, 'root', node_password)
+                cred['resourceType'] = _aria_node_resource_type(node_type)
+                credentials.append(cred)
+        except Exception as e:
+            logger.warning(f"Error parsing Aria Operations node credentials for {node_hostname}: {type(e).__name__}: {e}")
+            continue
+    return credentials
+
+
+def _parse_fleet_management(fleet_spec: Dict) -> List[Dict]:
+    """VCF Operations Fleet Management credentials from vcfOperationsFleetManagementSpec"""
+    credentials = []
+    hostname = fleet_spec.get('hostname', '')
+    
+    if fleet_spec.get('rootUserPassword'):
+        credentials.append(_mk('ARIA_NETWORKS_SSH', hostname, 'root', fleet_spec['rootUserPassword']))
+    if fleet_spec.get('adminUserPassword'):
+        credentials.append(_mk('ARIA_NETWORKS_API', hostname, 'admin', fleet_spec['adminUserPassword']))
+    return credentials
+
+
+def _parse_operations_collector(collector_spec: Dict) -> List[Dict]:
+    """VCF Operations Collector credentials from vcfOperationsCollectorSpec"""
+    credentials = []
+    hostname = collector_spec.get('hostname', '')
+    
+    if collector_spec.get('rootUserPassword'):
+        credentials.append(_mk('ARIA_LOGS_SSH', hostname, 'root', collector_spec['rootUserPassword']))
+    return credentials
+
+
+# Installer spec sections and the parser for each, in output order
+_INSTALLER_PARSERS = (
+    ('hostSpecs', _parse_hosts),
+    ('vcenterSpec', _parse_vcenter),
+    ('nsxtSpec', _parse_nsxt),
+    ('sddcManagerSpec', _parse_sddc_manager),
+    ('vcfOperationsSpec', _parse_vcf_operations),
+    ('vcfOperationsFleetManagementSpec', _parse_fleet_management),
+    ('vcfOperationsCollectorSpec', _parse_operations_collector),
+)
+
 
 class VCFCredentialFetcher:
     """Fetches credentials from VCF Installer and SDDC Manager"""
     
     def __init__(self):
+        # Shared session keeps TLS connections alive between calls to the same host
         self.session = requests.Session()
+        # Pool sized so parallel spec fetches reuse connections instead of discarding them.
+        # Only transient gateway responses are retried; connect and read failures fail
+        # fast so a dead host can't outlast the web worker timeout. raise_on_status=False
+        # keeps the final response so raise_for_status() still surfaces the usual HTTPError.
+        retry = Retry(
+            total=None,
+            connect=0,
+            read=0,
+            other=0,
+            status=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Every VCF endpoint used here returns JSON; ask for it compressed since
+        # installer specs are large and requests decompresses transparently
+        self.session.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip, deflate"})
         # Set timeout for all requests
         self.timeout = 30
+        # Bearer tokens and their ready-made Authorization headers keyed by
+        # (host, username, password digest); passwords themselves are never stored
+        self._token_cache: Dict[Tuple[str, str, bytes], Tuple[str, Dict[str, str], float]] = {}
+        self._token_lock = threading.Lock()
     
-    def _get_token(self, host: str, username: str, password: str, ssl_verify: bool = False) -> str:
-        """Get authentication token"""
+    def _get_token(self, host: str, username: str, password: str, ssl_verify: bool = False,
+                   use_cache: bool = True) -> str:
+        """Get authentication token
+        
+        Tokens are reused for TOKEN_TTL_SECONDS, but only for the exact same
+        credentials. Pass use_cache=False to force a real login that neither reads
+        nor updates the cache, e.g. when testing whether credentials are valid.
+        """
+        key = self._token_key(host, username, password)
+        if use_cache:
+            with self._token_lock:
+                cached = self._token_cache.get(key)
+            if cached and time.monotonic() - cached[2] < TOKEN_TTL_SECONDS:
+                logger.debug(f"Using cached token for {host}")
+                return cached[0]
+        
         url = f"https://{host}/v1/tokens"
         headers = {"Content-Type": "application/json"}
         payload = {
@@ -42,8 +331,11 @@ class VCFCredentialFetcher:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            token = response.json().get("accessToken")
+            token = json_loads(response.content).get("accessToken")
             logger.debug(f"Successfully obtained token from {host}")
+            if token and use_cache:
+                with self._token_lock:
+                    self._token_cache[key] = (token, {"Authorization": f"Bearer {token}"}, time.monotonic())
             return token
         except requests.exceptions.SSLError as e:
             logger.error(f"SSL Error connecting to {host} - try disabling SSL verification")
@@ -72,51 +364,85 @@ class VCFCredentialFetcher:
             logger.error(f"Error getting token from {host}: {type(e).__name__}")
             raise
     
+    @staticmethod
+    def _token_key(host: str, username: str, password: str) -> Tuple[str, str, bytes]:
+        """Cache key for a login; a changed or wrong password never matches another's token"""
+        return host, username, hashlib.sha256(password.encode()).digest()
+    
+    def _get_auth_headers(self, host: str, username: str, password: str, ssl_verify: bool = False) -> Dict[str, str]:
+        """Authorization headers for a token, shared by every request that uses it"""
+        token = self._get_token(host, username, password, ssl_verify)
+        with self._token_lock:
+            cached = self._token_cache.get(self._token_key(host, username, password))
+        if cached and cached[0] == token:
+            return cached[1]
+        return {"Authorization": f"Bearer {token}"}
+    
+    def _invalidate_token(self, host: str, username: str, password: str):
+        """Drop a cached token, e.g. after the server rejected it"""
+        with self._token_lock:
+            self._token_cache.pop(self._token_key(host, username, password), None)
+    
+    def _get_authorized(self, url: str, host: str, username: str, password: str, ssl_verify: bool):
+        """GET with a (possibly cached) bearer token, logging in again once on 401
+        
+        Returns:
+            tuple: (response, headers) - headers carry the token that was accepted
+        """
+        headers = self._get_auth_headers(host, username, password, ssl_verify)
+        response = self.session.get(url, headers=headers, verify=ssl_verify, timeout=self.timeout)
+        
+        if response.status_code == 401:
+            logger.debug(f"Token rejected by {host}, requesting a new one")
+            self._invalidate_token(host, username, password)
+            headers = self._get_auth_headers(host, username, password, ssl_verify)
+            response = self.session.get(url, headers=headers, verify=ssl_verify, timeout=self.timeout)
+        
+        return response, headers
+    
     def fetch_from_installer(self, host: str, username: str, password: str, ssl_verify: bool = False) -> List[Dict]:
         """Fetch credentials from VCF Installer"""
         credentials = []
         
         try:
-            # Get token
-            token = self._get_token(host, username, password, ssl_verify)
-            
             # Get SDDCs
             url = f"https://{host}/v1/sddcs"
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/json"
-            }
-            
-            response = self.session.get(url, headers=headers, verify=ssl_verify, timeout=self.timeout)
+            response, headers = self._get_authorized(url, host, username, password, ssl_verify)
             response.raise_for_status()
-            sddcs = response.json().get("elements", [])
+            sddcs = json_loads(response.content).get("elements", [])
             
             logger.debug(f"Found {len(sddcs)} SDDCs from installer {host}")
             
-            # Get credentials for each SDDC
-            for sddc in sddcs:
-                sddc_id = sddc.get("id")
-                sddc_name = sddc.get("name", sddc_id)
-                
-                if sddc_id:
-                    try:
-                        spec_url = f"https://{host}/v1/sddcs/{sddc_id}/spec"
-                        spec_response = self.session.get(spec_url, headers=headers, verify=ssl_verify, timeout=self.timeout)
-                        spec_response.raise_for_status()
-                        spec_data = spec_response.json()
-                        
-                        logger.debug(f"Parsing spec for SDDC: {sddc_name}")
-                        
-                        # Parse credentials from spec
-                        creds = self._parse_installer_spec(spec_data)
-                        credentials.extend(creds)
-                        
-                        logger.debug(f"Extracted {len(creds)} credentials from SDDC: {sddc_name}")
-                        
-                    except Exception as e:
-                        logger.error(f"Error parsing SDDC {sddc_name}: {e}", exc_info=True)
-                        # Continue with other SDDCs
-                        continue
+            # Get credentials for each SDDC; spec requests run in parallel since they only wait on I/O
+            sddc_list = [(sddc["id"], sddc.get("name", sddc["id"])) for sddc in sddcs if sddc.get("id")]
+            
+            def fetch_spec(sddc_id):
+                spec_url = f"https://{host}/v1/sddcs/{sddc_id}/spec"
+                spec_response = self.session.get(spec_url, headers=headers, verify=ssl_verify, timeout=self.timeout)
+                spec_response.raise_for_status()
+                return json_loads(spec_response.content)
+            
+            if sddc_list:
+                with ThreadPoolExecutor(max_workers=min(SPEC_FETCH_WORKERS, len(sddc_list))) as executor:
+                    futures = [(executor.submit(fetch_spec, sddc_id), sddc_name) for sddc_id, sddc_name in sddc_list]
+                    
+                    # Collect in submission order so the result order stays stable
+                    for future, sddc_name in futures:
+                        try:
+                            spec_data = future.result()
+                            
+                            logger.debug(f"Parsing spec for SDDC: {sddc_name}")
+                            
+                            # Parse credentials from spec straight into the result
+                            count = len(credentials)
+                            credentials.extend(self._parse_installer_spec(spec_data))
+                            
+                            logger.debug(f"Extracted {len(credentials) - count} credentials from SDDC: {sddc_name}")
+                            
+                        except Exception as e:
+                            logger.error(f"Error parsing SDDC {sddc_name}: {e}", exc_info=True)
+                            # Continue with other SDDCs
+                            continue
             
             return credentials
             
@@ -128,340 +454,98 @@ class VCFCredentialFetcher:
             logger.error(f"Error fetching from installer {host}: {type(e).__name__}: {str(e)[:100]}")
             raise
     
-    def _parse_installer_spec(self, spec_data: Dict) -> List[Dict]:
-        """Parse credentials from installer spec data"""
-        credentials = []
+    def fetch_all(self, targets: List[Dict]) -> List[Dict]:
+        """Fetch several installer/manager sources concurrently
         
-        try:
-            # Parse ESXi host credentials
-            if 'hostSpecs' in spec_data:
-                for host in spec_data['hostSpecs']:
-                    try:
-                        hostname = host.get('hostname', host.get('ipAddress', ''))
-                        
-                        # Credentials is a dictionary object (not a list)
-                        if 'credentials' in host and isinstance(host['credentials'], dict):
-                            creds_data = host['credentials']
-                            credentials.append({
-                                'hostname': hostname,
-                                'username': creds_data.get('username', ''),
-                                'password': creds_data.get('password', ''),
-                                'credentialType': 'SSH',
-                                'accountType': 'USER',
-                                'resourceType': 'ESXI',
-                                'source': 'VCF_INSTALLER'
-                            })
-                    except Exception as e:
-                        logger.error(f"Error parsing ESXi host credentials for {hostname}: {e}", exc_info=True)
-                        continue
-            
-            # Parse vCenter credentials
-            if 'vcenterSpec' in spec_data:
-                try:
-                    vcenter = spec_data['vcenterSpec']
-                    hostname = vcenter.get('vcenterHostname', vcenter.get('hostname', ''))
-                    sso_domain = vcenter.get('ssoDomain', 'vsphere.local')
-                    
-                    # Root password
-                    if 'rootVcenterPassword' in vcenter:
-                        credentials.append({
-                            'hostname': hostname,
-                            'username': 'root',
-                            'password': vcenter['rootVcenterPassword'],
-                            'credentialType': 'SSH',
-                            'accountType': 'USER',
-                            'resourceType': 'VCENTER',
-                            'source': 'VCF_INSTALLER'
-                        })
-                    
-                    # SSO Admin password
-                    if 'adminUserSsoPassword' in vcenter:
-                        admin_user = f"administrator@{sso_domain}"
-                        credentials.append({
-                            'hostname': hostname,
-                            'username': admin_user,
-                            'password': vcenter['adminUserSsoPassword'],
-                            'credentialType': 'SSO',
-                            'accountType': 'SERVICE',
-                            'resourceType': 'VCENTER',
-                            'source': 'VCF_INSTALLER'
-                        })
-                except Exception as e:
-                    logger.error(f"Error parsing vCenter credentials: {e}", exc_info=True)
-            
-            # Parse NSX-T credentials
-            if 'nsxtSpec' in spec_data:
-                try:
-                    nsxt = spec_data['nsxtSpec']
-                    vip_fqdn = nsxt.get('vipFqdn', '')
-                    
-                    # NSX Manager nodes
-                    if 'nsxtManagers' in nsxt:
-                        for manager in nsxt['nsxtManagers']:
-                            try:
-                                hostname = manager.get('hostname', manager.get('name', ''))
-                                
-                                # Root password (shared across all managers)
-                                if 'rootNsxtManagerPassword' in nsxt:
-                                    credentials.append({
-                                        'hostname': hostname,
-                                        'username': 'root',
-                                        'password': nsxt['rootNsxtManagerPassword'],
-                                        'credentialType': 'SSH',
-                                        'accountType': 'USER',
-                                        'resourceType': 'NSX_MANAGER',
-                                        'source': 'VCF_INSTALLER'
-                                    })
-                                
-                                # Admin password (shared across all managers)
-                                if 'nsxtAdminPassword' in nsxt:
-                                    credentials.append({
-                                        'hostname': hostname,
-                                        'username': 'admin',
-                                        'password': nsxt['nsxtAdminPassword'],
-                                        'credentialType': 'API',
-                                        'accountType': 'SERVICE',
-                                        'resourceType': 'NSX_MANAGER',
-                                        'source': 'VCF_INSTALLER'
-                                    })
-                                
-                                # Audit password (shared across all managers)
-                                if 'nsxtAuditPassword' in nsxt:
-                                    credentials.append({
-                                        'hostname': hostname,
-                                        'username': 'audit',
-                                        'password': nsxt['nsxtAuditPassword'],
-                                        'credentialType': 'API',
-                                        'accountType': 'SERVICE',
-                                        'resourceType': 'NSX_MANAGER',
-                                        'source': 'VCF_INSTALLER'
-                                    })
-                            except Exception as e:
-                                logger.error(f"Error parsing NSX manager credentials for {hostname}: {e}", exc_info=True)
-                                continue
-                    
-                    # Also add VIP credentials if available
-                    if vip_fqdn:
-                        if 'rootNsxtManagerPassword' in nsxt:
-                            credentials.append({
-                                'hostname': vip_fqdn,
-                                'username': 'root',
-                                'password': nsxt['rootNsxtManagerPassword'],
-                                'credentialType': 'SSH',
-                                'accountType': 'USER',
-                                'resourceType': 'NSX_VIP',
-                                'source': 'VCF_INSTALLER'
-                            })
-                        
-                        if 'nsxtAdminPassword' in nsxt:
-                            credentials.append({
-                                'hostname': vip_fqdn,
-                                'username': 'admin',
-                                'password': nsxt['nsxtAdminPassword'],
-                                'credentialType': 'API',
-                                'accountType': 'SERVICE',
-                                'resourceType': 'NSX_VIP',
-                                'source': 'VCF_INSTALLER'
-                            })
-                        
-                        if 'nsxtAuditPassword' in nsxt:
-                            credentials.append({
-                                'hostname': vip_fqdn,
-                                'username': 'audit',
-                                'password': nsxt['nsxtAuditPassword'],
-                                'credentialType': 'API',
-                                'accountType': 'SERVICE',
-                                'resourceType': 'NSX_VIP',
-                                'source': 'VCF_INSTALLER'
-                            })
-                except Exception as e:
-                    logger.error(f"Error parsing NSX-T credentials: {e}", exc_info=True)
-            
-            # Parse SDDC Manager credentials
-            if 'sddcManagerSpec' in spec_data:
-                try:
-                    manager = spec_data['sddcManagerSpec']
-                    hostname = manager.get('hostname', '')
-                    
-                    # Root password
-                    if 'rootPassword' in manager:
-                        credentials.append({
-                            'hostname': hostname,
-                            'username': 'root',
-                            'password': manager['rootPassword'],
-                            'credentialType': 'SSH',
-                            'accountType': 'USER',
-                            'resourceType': 'SDDC_MANAGER',
-                            'source': 'VCF_INSTALLER'
-                        })
-                    
-                    # Admin@local user (UI/API access)
-                    if 'localUserPassword' in manager:
-                        credentials.append({
-                            'hostname': hostname,
-                            'username': 'admin@local',
-                            'password': manager['localUserPassword'],
-                            'credentialType': 'API',
-                            'accountType': 'SERVICE',
-                            'resourceType': 'SDDC_MANAGER',
-                            'source': 'VCF_INSTALLER'
-                        })
-                    
-                    # VCF user (SSH access)
-                    if 'localUserPassword' in manager:
-                        credentials.append({
-                            'hostname': hostname,
-                            'username': 'vcf',
-                            'password': manager['localUserPassword'],
-                            'credentialType': 'SSH',
-                            'accountType': 'SERVICE',
-                            'resourceType': 'SDDC_MANAGER',
-                            'source': 'VCF_INSTALLER'
-                        })
-                    
-                    # SSH password (if different from localUserPassword)
-                    if 'sshPassword' in manager and manager.get('sshPassword') != manager.get('localUserPassword'):
-                        credentials.append({
-                            'hostname': hostname,
-                            'username': 'vcf',
-                            'password': manager['sshPassword'],
-                            'credentialType': 'SSH',
-                            'accountType': 'SERVICE',
-                            'resourceType': 'SDDC_MANAGER',
-                            'source': 'VCF_INSTALLER'
-                        })
-                except Exception as e:
-                    logger.error(f"Error parsing SDDC Manager credentials: {e}", exc_info=True)
-            
-            # Parse VCF Operations (Aria Operations) credentials
-            if 'vcfOperationsSpec' in spec_data:
-                try:
-                    ops_spec = spec_data['vcfOperationsSpec']
-                    load_balancer_fqdn = ops_spec.get('loadBalancerFqdn', '')
-                    
-                    # Admin user password (for UI/API access)
-                    if 'adminUserPassword' in ops_spec and load_balancer_fqdn:
-                        credentials.append({
-                            'hostname': load_balancer_fqdn,
-                            'username': 'admin',
-                            'password': ops_spec['adminUserPassword'],
-                            'credentialType': 'API',
-                            'accountType': 'SERVICE',
-                            'resourceType': 'ARIA_OPERATIONS',
-                            'source': 'VCF_INSTALLER'
-                        })
-                    
-                    # Node-specific root passwords
-                    if 'nodes' in ops_spec:
-                        for node in ops_spec['nodes']:
-                            try:
-                                node_hostname = node.get('hostname', '')
-                                node_type = node.get('type', 'unknown')
-                                
-                                if 'rootUserPassword' in node:
-                                    credentials.append({
-                                        'hostname': node_hostname,
-                                        'username': 'root',
-                                        'password': node['rootUserPassword'],
-                                        'credentialType': 'SSH',
-                                        'accountType': 'USER',
-                                        'resourceType': f'ARIA_OPERATIONS_{node_type.upper()}',
-                                        'source': 'VCF_INSTALLER'
-                                    })
-                            except Exception as e:
-                                logger.error(f"Error parsing Aria Operations node credentials for {node_hostname}: {e}", exc_info=True)
-                                continue
-                except Exception as e:
-                    logger.error(f"Error parsing VCF Operations credentials: {e}", exc_info=True)
-            
-            # Parse VCF Operations Fleet Management (Aria Operations for Networks) credentials
-            if 'vcfOperationsFleetManagementSpec' in spec_data:
-                try:
-                    fleet_spec = spec_data['vcfOperationsFleetManagementSpec']
-                    hostname = fleet_spec.get('hostname', '')
-                    
-                    # Root password
-                    if 'rootUserPassword' in fleet_spec:
-                        credentials.append({
-                            'hostname': hostname,
-                            'username': 'root',
-                            'password': fleet_spec['rootUserPassword'],
-                            'credentialType': 'SSH',
-                            'accountType': 'USER',
-                            'resourceType': 'ARIA_OPERATIONS_NETWORKS',
-                            'source': 'VCF_INSTALLER'
-                        })
-                    
-                    # Admin password
-                    if 'adminUserPassword' in fleet_spec:
-                        credentials.append({
-                            'hostname': hostname,
-                            'username': 'admin',
-                            'password': fleet_spec['adminUserPassword'],
-                            'credentialType': 'API',
-                            'accountType': 'SERVICE',
-                            'resourceType': 'ARIA_OPERATIONS_NETWORKS',
-                            'source': 'VCF_INSTALLER'
-                        })
-                except Exception as e:
-                    logger.error(f"Error parsing Fleet Management credentials: {e}", exc_info=True)
+        Args:
+            targets: dicts with 'kind' ('installer' or 'manager'), 'host', 'username',
+                     'password' and optionally 'ssl_verify'
+        
+        Returns:
+            One result per target, in the same order: the target's 'kind' and 'host' plus
+            'credentials' (list, empty on failure) and 'error' (the exception or None).
+            Errors are returned rather than logged so the caller reports each one once.
+        """
+        fetchers = {'installer': self.fetch_from_installer, 'manager': self.fetch_from_manager}
+        results = []
+        if not targets:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(targets))) as executor:
+            futures = [
+                (target, executor.submit(
+                    fetchers[target['kind']],
+                    host=target['host'],
+                    username=target['username'],
+                    password=target['password'],
+                    ssl_verify=target.get('ssl_verify', False)
+                ))
+                for target in targets
+            ]
             
-            # Parse VCF Operations Collector (Aria Operations for Logs) credentials
-            if 'vcfOperationsCollectorSpec' in spec_data:
+            for target, future in futures:
+                result = {'kind': target['kind'], 'host': target['host'], 'credentials': [], 'error': None}
                 try:
-                    collector_spec = spec_data['vcfOperationsCollectorSpec']
-                    hostname = collector_spec.get('hostname', '')
-                    
-                    # Root password
-                    if 'rootUserPassword' in collector_spec:
-                        credentials.append({
-                            'hostname': hostname,
-                            'username': 'root',
-                            'password': collector_spec['rootUserPassword'],
-                            'credentialType': 'SSH',
-                            'accountType': 'USER',
-                            'resourceType': 'ARIA_OPERATIONS_LOGS',
-                            'source': 'VCF_INSTALLER'
-                        })
+                    result['credentials'] = future.result()
                 except Exception as e:
-                    logger.error(f"Error parsing Operations Collector credentials: {e}", exc_info=True)
+                    result['error'] = e
+                results.append(result)
         
-        except Exception as e:
-            logger.error(f"Error in _parse_installer_spec: {e}", exc_info=True)
+        return results
+    
+    def _parse_installer_spec(self, spec_data: Dict) -> Iterator[Dict]:
+        """Parse credentials from installer spec data, yielding each one"""
+        seen = set()
         
-        return credentials
+        # One pass over the known component specs; absent or empty sections are skipped
+        for spec_key, parser in _INSTALLER_PARSERS:
+            section = spec_data.get(spec_key)
+            if not section:
+                continue
+            try:
+                for cred in parser(section):
+                    # Keep the first record per identity, as the sync would
+                    key = _credential_key(cred)
+                    if key not in seen:
+                        seen.add(key)
+                        yield cred
+            except Exception as e:
+                logger.error(f"Error parsing {spec_key} credentials: {e}", exc_info=True)
     
     def fetch_from_manager(self, host: str, username: str, password: str, ssl_verify: bool = False) -> List[Dict]:
         """Fetch credentials from SDDC Manager"""
-        # Get token
-        token = self._get_token(host, username, password, ssl_verify)
-        
         # Get credentials
         url = f"https://{host}/v1/credentials"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json"
-        }
-        
-        response = self.session.get(url, headers=headers, verify=ssl_verify, timeout=self.timeout)
+        response, _ = self._get_authorized(url, host, username, password, ssl_verify)
         response.raise_for_status()
-        credentials = response.json().get("elements", [])
+        credentials = json_loads(response.content).get("elements", [])
         
         logger.debug(f"Found {len(credentials)} credentials from SDDC Manager {host}")
         
         # Format credentials
-        formatted_creds = []
-        for cred in credentials:
-            formatted_creds.append({
-                'hostname': cred.get('resource', {}).get('resourceName', ''),
+        formatted = [
+            {
+                'hostname': resource.get('resourceName', ''),
                 'username': cred.get('username', ''),
                 'password': cred.get('password', ''),
                 'credentialType': cred.get('credentialType', 'USER'),
                 'accountType': cred.get('accountType', 'USER'),
-                'resourceType': cred.get('resource', {}).get('resourceType', ''),
-                'domainName': cred.get('resource', {}).get('domainName', ''),
+                'resourceType': resource.get('resourceType', ''),
+                'domainName': resource.get('domainName', ''),
                 'source': 'SDDC_MANAGER'
-            })
+            }
+            for cred in credentials
+            for resource in (cred.get('resource') or _EMPTY,)
+        ]
+        
+        # Skip repeats of the same identity
+        formatted_creds = []
+        seen = set()
+        for cred in formatted:
+            key = _credential_key(cred)
+            if key not in seen:
+                seen.add(key)
+                formatted_creds.append(cred)
         
         return formatted_creds
 